@@ -8,12 +8,18 @@ Usage:
   python compare_intermediate.py --domain ALL --ground-truth verified_data.jsonl --output results/reeval.json
 """
 import argparse
-import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
+from typing import Optional
 
+from src import jsonio
 from src.evaluator.comparator import GroundTruthComparator
-from src.types import CrawlerType, LLMType, ExtractedFeatures
+from src.types import CrawlerType, LLMType, ExtractedFeatures, EvaluationResult
 from src.pipeline.summary import compute_summary, print_summary_stats
 
 
@@ -25,17 +31,157 @@ def _resolve_domain_dir(base_dir: Path, domain: str) -> Path:
     return domain_dir
 
 
+def _scan_json(base: Path, depth: int) -> list[Path]:
+    """List ``*.json`` files exactly ``depth`` directories below base, sorted.
+
+    Equivalent to ``sorted(base.glob("*/" * depth + "*.json"))`` (hidden entries
+    included, directory symlinks followed) but walks with os.scandir.
+    """
+    dirs = [os.fspath(base)]
+    for _ in range(depth):
+        subdirs = []
+        for path in dirs:
+            with os.scandir(path) as it:
+                subdirs.extend(entry.path for entry in it if entry.is_dir())
+        dirs = subdirs
+    files = []
+    for path in dirs:
+        with os.scandir(path) as it:
+            files.extend(Path(entry.path) for entry in it if entry.name.endswith(".json"))
+    files.sort()
+    return files
+
+
 def load_intermediate_files(base_dir: Path, domain: str) -> list[Path]:
     domain_dir = _resolve_domain_dir(base_dir, domain)
     if not domain_dir.exists():
         raise FileNotFoundError(f"No intermediate data found for {domain_dir}")
-    return sorted(domain_dir.glob("*/*.json"))
+    return _scan_json(domain_dir, 1)
 
 
 def load_all_intermediate_files(base_dir: Path) -> list[Path]:
     if not base_dir.exists():
         return []
-    return sorted(base_dir.glob("*/*/*.json"))
+    return _scan_json(base_dir, 2)
+
+
+@lru_cache(maxsize=32)
+def _crawler(value: str) -> CrawlerType:
+    return CrawlerType(value)
+
+
+@lru_cache(maxsize=32)
+def _llm(value: str) -> LLMType:
+    return LLMType(value)
+
+
+_DIFF_KEYS = ("feature", "score", "match_type", "extracted", "ground_truth")
+_diff_fields = attrgetter("feature_name", "score", "match_type", "extracted_value", "ground_truth_value")
+_PRESENCE_KEYS = ("feature", "extracted_present", "ground_truth_present")
+_presence_fields = attrgetter("feature_name", "extracted_present", "ground_truth_present")
+
+
+# Files handed to a pool worker per task; runs with fewer files stay in-process
+_CHUNKSIZE = 16
+
+# Per-process state, set by _set_state (directly, or via _init_worker in pool workers).
+_comparator: Optional[GroundTruthComparator] = None
+_show_all = False
+_show_diffs = False
+
+
+def _set_state(comparator: GroundTruthComparator, show_all: bool, show_diffs: bool):
+    global _comparator, _show_all, _show_diffs
+    _comparator = comparator
+    _show_all = show_all
+    _show_diffs = show_diffs
+
+
+def _init_worker(ground_truth_path: Path, use_cache: bool, show_all: bool, show_diffs: bool):
+    _set_state(GroundTruthComparator(ground_truth_path, use_cache=use_cache), show_all, show_diffs)
+
+
+def _evaluate_path(path: Path) -> tuple[dict, EvaluationResult, list[str]]:
+    """Evaluate one intermediate file; returns (entry, result, diff lines to print)."""
+    data = jsonio.loads(path.read_bytes())
+    crawler = _crawler(data["crawler"])
+    llm = _llm(data["llm"])
+    extraction = ExtractedFeatures(
+        domain=data["domain"],
+        crawler=crawler,
+        llm=llm,
+        extracted_at=datetime.now(),
+        features=data.get("extraction", {}).get("features", {}),
+        raw_llm_response=data.get("extraction", {}).get("raw_llm_response", ""),
+        error=data.get("extraction", {}).get("error"),
+    )
+    result = _comparator.evaluate(extraction)
+
+    rows = result.feature_scores if _show_all else [
+        fs for fs in result.feature_scores if fs.score < 0.8
+    ]
+    presence_rows = [ps for ps in result.presence_scores if ps.score < 1.0]
+
+    entry = {
+        "domain": data["domain"],
+        "crawler": crawler.value,
+        "llm": llm.value,
+        "accuracy": result.overall_accuracy,
+        "presence_accuracy": result.overall_presence_accuracy,
+        "features_correct": result.features_correct,
+        "features_present_correct": result.features_present_correct,
+        "features_total": len(result.feature_scores),
+        "diffs": [dict(zip(_DIFF_KEYS, _diff_fields(fs))) for fs in rows],
+        "presence_diffs": [dict(zip(_PRESENCE_KEYS, _presence_fields(ps))) for ps in presence_rows],
+    }
+
+    lines = []
+    if _show_diffs:
+        lines.append("=" * 80)
+        lines.append(f"{data['domain']} | {crawler.value} | {llm.value}")
+        lines.append(f"Accuracy: {result.overall_accuracy:.0%} "
+                     f"({result.features_correct}/{len(result.feature_scores)} correct)")
+
+        if not entry["diffs"]:
+            lines.append("No diffs (all correct or no ground truth).")
+        else:
+            for fs in entry["diffs"]:
+                lines.append(f"- {fs['feature']}: score={fs['score']:.2f} "
+                             f"match={fs['match_type']}")
+                lines.append(f"  extracted: {fs['extracted']}")
+                lines.append(f"  ground_truth: {fs['ground_truth']}")
+
+        if entry["presence_diffs"]:
+            lines.append("Presence diffs:")
+            for ps in entry["presence_diffs"]:
+                lines.append(f"- {ps['feature']}: extracted_present={ps['extracted_present']} "
+                             f"ground_truth_present={ps['ground_truth_present']}")
+
+    return entry, result, lines
+
+
+def _evaluate_files(
+    files: list[Path],
+    comparator: GroundTruthComparator,
+    ground_truth_path: Path,
+    use_cache: bool,
+    show_all: bool,
+    show_diffs: bool,
+    workers: int,
+):
+    """Yield _evaluate_path results in file order, using a process pool only when
+    there is at least a chunk of files per worker."""
+    workers = min(workers, math.ceil(len(files) / _CHUNKSIZE))
+    if workers <= 1:
+        _set_state(comparator, show_all, show_diffs)
+        yield from map(_evaluate_path, files)
+        return
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(ground_truth_path, use_cache, show_all, show_diffs),
+    ) as executor:
+        yield from executor.map(_evaluate_path, files, chunksize=_CHUNKSIZE)
 
 
 def main():
@@ -46,9 +192,12 @@ def main():
     parser.add_argument("--show-diffs", action="store_true", help="Show per-feature diffs")
     parser.add_argument("--show-all", action="store_true", help="Show all features (not just diffs)")
     parser.add_argument("--output", type=Path, help="Write results to JSON file")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="Worker processes for evaluation (default: CPU count)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-parse the ground truth JSONL instead of using its .cache.pkl")
     args = parser.parse_args()
 
-    comparator = GroundTruthComparator(args.ground_truth)
     if args.domain.upper() == "ALL":
         files = load_all_intermediate_files(args.intermediate_dir)
     else:
@@ -61,81 +210,23 @@ def main():
     }
     eval_results = []
 
-    for path in files:
-        data = json.loads(path.read_text())
-        crawler = CrawlerType(data["crawler"])
-        llm = LLMType(data["llm"])
-        extraction = ExtractedFeatures(
-            domain=data["domain"],
-            crawler=crawler,
-            llm=llm,
-            extracted_at=datetime.now(),
-            features=data.get("extraction", {}).get("features", {}),
-            raw_llm_response=data.get("extraction", {}).get("raw_llm_response", ""),
-            error=data.get("extraction", {}).get("error"),
-        )
-        result = comparator.evaluate(extraction)
+    # Loading the ground truth here fails fast on a bad path and warms the
+    # .cache.pkl that pool workers then read instead of re-parsing the JSONL
+    comparator = GroundTruthComparator(args.ground_truth, use_cache=not args.no_cache)
+    evaluated = _evaluate_files(
+        files, comparator, args.ground_truth, not args.no_cache,
+        args.show_all, args.show_diffs and not args.output,
+        max(1, args.workers or 1),
+    )
+    for entry, result, lines in evaluated:
         eval_results.append(result)
-
-        rows = result.feature_scores if args.show_all else [
-            fs for fs in result.feature_scores if fs.score < 0.8
-        ]
-        presence_rows = [ps for ps in result.presence_scores if ps.score < 1.0]
-
-        entry = {
-            "domain": data["domain"],
-            "crawler": crawler.value,
-            "llm": llm.value,
-            "accuracy": result.overall_accuracy,
-            "presence_accuracy": result.overall_presence_accuracy,
-            "features_correct": result.features_correct,
-            "features_present_correct": result.features_present_correct,
-            "features_total": len(result.feature_scores),
-            "diffs": [
-                {
-                    "feature": fs.feature_name,
-                    "score": fs.score,
-                    "match_type": fs.match_type,
-                    "extracted": fs.extracted_value,
-                    "ground_truth": fs.ground_truth_value,
-                }
-                for fs in rows
-            ],
-            "presence_diffs": [
-                {
-                    "feature": ps.feature_name,
-                    "extracted_present": ps.extracted_present,
-                    "ground_truth_present": ps.ground_truth_present,
-                }
-                for ps in presence_rows
-            ],
-        }
         out["results"].append(entry)
-
-        if not args.output and args.show_diffs:
-            print("=" * 80)
-            print(f"{data['domain']} | {crawler.value} | {llm.value}")
-            print(f"Accuracy: {result.overall_accuracy:.0%} "
-                  f"({result.features_correct}/{len(result.feature_scores)} correct)")
-
-            if not entry["diffs"]:
-                print("No diffs (all correct or no ground truth).")
-            else:
-                for fs in entry["diffs"]:
-                    print(f"- {fs['feature']}: score={fs['score']:.2f} "
-                          f"match={fs['match_type']}")
-                    print(f"  extracted: {fs['extracted']}")
-                    print(f"  ground_truth: {fs['ground_truth']}")
-
-            if entry["presence_diffs"]:
-                print("Presence diffs:")
-                for ps in entry["presence_diffs"]:
-                    print(f"- {ps['feature']}: extracted_present={ps['extracted_present']} "
-                          f"ground_truth_present={ps['ground_truth_present']}")
+        for line in lines:
+            print(line)
 
     if args.output:
         args.output.parent.mkdir(parents=True, exist_ok=True)
-        args.output.write_text(json.dumps(out, indent=2, default=str))
+        args.output.write_bytes(jsonio.dumps(out, indent=True))
         print(f"Wrote {args.output}")
     else:
         total_domains = len({r.domain for r in eval_results})
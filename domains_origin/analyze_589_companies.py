@@ -5,13 +5,75 @@ Analyzes same-domain links on B2B SaaS company homepages - optimized for 589 com
 
 import asyncio
 import csv
-import json
+import re
+import socket
+import ssl
+import sys
+from importlib.util import find_spec
 from typing import Dict, List, Set
-from urllib.parse import urlparse, urljoin, urlunparse
-import statistics
+from urllib.parse import SplitResult, urljoin, urlsplit, urlunsplit
 
 import aiohttp
-from bs4 import BeautifulSoup
+import numpy as np
+
+try:
+    import orjson
+
+    def dump_links(links: List[str]) -> str:
+        return orjson.dumps(links).decode('utf-8')
+except ImportError:
+    import json
+
+    def dump_links(links: List[str]) -> str:
+        return json.dumps(links)
+
+uvloop = None
+if sys.platform != 'win32':
+    try:
+        import uvloop  # libuv-backed event loop, used by run() when available
+    except ImportError:
+        pass
+
+try:
+    import aiodns  # enables aiohttp.AsyncResolver
+except ImportError:
+    aiodns = None
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:  # fall back to lxml (installed with trafilatura)
+    HTMLParser = None
+    import lxml.html
+    LXML_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+
+
+# Markers of client-side rendered apps, matched case-insensitively in a single pass.
+JS_INDICATOR_RE = re.compile(
+    '|'.join(re.escape(indicator) for indicator in (
+        'id="root"',
+        'id="app"',
+        'data-reactroot',
+        'data-react-root',
+        'ng-app',
+        'v-cloak',
+        '__NEXT_DATA__',
+        '__nuxt',
+    )),
+    re.IGNORECASE,
+)
+# hrefs that never point at a crawlable page; scheme names are case-insensitive.
+BAD_HREF_PREFIX_RE = re.compile(r'(?:mailto:|tel:|javascript:|data:|void\(|#)', re.IGNORECASE)
+NOSCRIPT_HINT_RE = re.compile('enable|javascript|required|need', re.IGNORECASE)
+
+CSV_FIELDNAMES = ['domain', 'total_links', 'same_domain_links', 'status', 'notes', 'same_domain_links_array', 'all_links_array']
+
+# Failures on https:// after which retrying over plain http:// is worthwhile.
+TLS_ERROR = 'TLS error'
+CONNECT_ERROR = 'Connection error'
+HTTP_FALLBACK_ERRORS = (TLS_ERROR, CONNECT_ERROR)
+
+# Homepages larger than this are truncated; links near the top are all we need.
+MAX_HTML_BYTES = 2 * 1024 * 1024
 
 
 class HomepageLinkAnalyzer:
@@ -21,15 +83,19 @@ class HomepageLinkAnalyzer:
         self.max_concurrent = max_concurrent
         self.timeout = timeout
         self.max_retries = max_retries
-        self.results = []
+        self.results = []  # slim per-domain summaries; full rows go straight to the CSV
         self.completed_count = 0
+        self._csv_file = None
+        self._writer = None
+        self._timeout = aiohttp.ClientTimeout(total=timeout, connect=min(10, timeout))
 
         # Browser-like headers
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
+            # aiohttp can only decode br bodies when a brotli binding is installed
+            'Accept-Encoding': 'gzip, deflate, br' if find_spec('brotli') or find_spec('brotlicffi') else 'gzip, deflate',
             'DNT': '1',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
@@ -46,32 +112,17 @@ class HomepageLinkAnalyzer:
                     domains.append(domain)
         return domains
 
-    def normalize_url(self, url: str) -> str:
-        """Normalize URL for deduplication."""
-        parsed = urlparse(url)
+    def normalize_url(self, parsed: SplitResult) -> str:
+        """Normalize an already-split URL for deduplication (drops the fragment)."""
         path = parsed.path.rstrip('/') if parsed.path != '/' else '/'
-        normalized = urlunparse((
-            parsed.scheme,
-            parsed.netloc,
-            path,
-            parsed.params,
-            parsed.query,
-            ''
-        ))
-        return normalized
+        if not parsed.netloc:
+            return urlunsplit((parsed.scheme, parsed.netloc, path, parsed.query, ''))
+        normalized = f'{parsed.scheme}://{parsed.netloc}{path}'
+        return f'{normalized}?{parsed.query}' if parsed.query else normalized
 
-    def is_same_domain(self, base_url: str, link_url: str) -> bool:
-        """Check if a link URL is from the same domain as the base URL."""
-        base_parsed = urlparse(base_url)
-        link_parsed = urlparse(link_url)
-
-        base_hostname = base_parsed.hostname or ''
-        link_hostname = link_parsed.hostname or ''
-
-        base_hostname = base_hostname.replace('www.', '').lower()
-        link_hostname = link_hostname.replace('www.', '').lower()
-
-        return base_hostname == link_hostname
+    def is_same_domain(self, base_hostname: str, link: SplitResult) -> bool:
+        """Check if a split link URL is on the same host as base_hostname."""
+        return (link.hostname or '').removeprefix('www.') == base_hostname
 
     def is_valid_link(self, href: str, current_page_path: str = '') -> bool:
         """Check if href is a valid link."""
@@ -80,62 +131,78 @@ class HomepageLinkAnalyzer:
 
         href = href.strip()
 
-        if href.startswith(('mailto:', 'tel:', 'javascript:', 'data:', 'void(', '#')):
+        if BAD_HREF_PREFIX_RE.match(href):
             return False
 
-        if '#' in href and current_page_path:
-            if href.startswith('#'):
-                return False
-            path_before_anchor = href.split('#')[0]
-            if not path_before_anchor or path_before_anchor == current_page_path:
+        if current_page_path and href.find('#') > 0:  # a leading '#' was rejected above
+            path_before_anchor = href.partition('#')[0]
+            if path_before_anchor == current_page_path:
                 return False
 
         return True
 
-    def detect_js_heavy_page(self, html: str, link_count: int) -> bool:
-        """Detect if a page appears to be JS-heavy."""
+    def parse_html(self, html: str):
+        """Parse HTML with selectolax when available, lxml otherwise."""
+        if HTMLParser is not None:
+            return HTMLParser(html)
+        return lxml.html.document_fromstring(html.encode('utf-8'), parser=LXML_PARSER)
+
+    def extract_hrefs(self, tree) -> List[str]:
+        """Return the raw href of every anchor that has one, as a flat list."""
+        if HTMLParser is not None:
+            return [node.attributes.get('href') or '' for node in tree.css('a[href]')]
+        return tree.xpath('//a/@href')
+
+    def iter_noscript_texts(self, tree):
+        """Yield the text content of every <noscript> tag."""
+        if HTMLParser is not None:
+            for node in tree.css('noscript'):
+                yield node.text()
+        else:
+            for node in tree.iter('noscript'):
+                yield node.text_content()
+
+    def detect_js_heavy_page(self, html: str, tree, link_count: int) -> bool:
+        """Detect if a page appears to be JS-heavy, reusing the already-parsed tree."""
         if link_count < 5:
-            soup = BeautifulSoup(html, 'html.parser')
-
-            js_indicators = [
-                'id="root"',
-                'id="app"',
-                'data-reactroot',
-                'data-react-root',
-                'ng-app',
-                'v-cloak',
-                '__NEXT_DATA__',
-                '__nuxt'
-            ]
-
-            html_lower = html.lower()
-            for indicator in js_indicators:
-                if indicator.lower() in html_lower:
-                    return True
+            if JS_INDICATOR_RE.search(html):
+                return True
 
-            noscript_tags = soup.find_all('noscript')
-            for tag in noscript_tags:
-                text = tag.get_text().lower()
-                if any(word in text for word in ['enable', 'javascript', 'required', 'need']):
+            for text in self.iter_noscript_texts(tree):
+                if NOSCRIPT_HINT_RE.search(text):
                     return True
 
         return False
 
+    async def read_html(self, response: aiohttp.ClientResponse) -> str:
+        """Read the body in chunks up to MAX_HTML_BYTES and decode it once."""
+        buf = bytearray()
+        async for chunk in response.content.iter_chunked(64 * 1024):
+            buf.extend(chunk)
+            if len(buf) >= MAX_HTML_BYTES:
+                del buf[MAX_HTML_BYTES:]
+                break
+        try:
+            return buf.decode(response.charset or 'utf-8', errors='replace')
+        except LookupError:  # unknown charset label
+            return buf.decode('utf-8', errors='replace')
+
     async def fetch_with_retry(self, session: aiohttp.ClientSession, url: str) -> tuple:
         """Fetch URL with retry logic."""
+        error_msg = "Failed to fetch"
         for attempt in range(self.max_retries):
             try:
+                # None uses the connector's shared context; the last attempt skips verification
                 ssl_context = None if attempt < 2 else False
 
                 async with session.get(
                     url,
-                    headers=self.headers,
-                    timeout=aiohttp.ClientTimeout(total=self.timeout),
+                    timeout=self._timeout,
                     allow_redirects=True,
                     ssl=ssl_context
                 ) as response:
                     if response.status == 200:
-                        html = await response.text()
+                        html = await self.read_html(response)
                         return html, str(response.url), response.status, None
                     else:
                         error_msg = f"HTTP {response.status}"
@@ -144,15 +211,21 @@ class HomepageLinkAnalyzer:
                         continue
 
             except asyncio.TimeoutError:
+                error_msg = "Timeout"
                 continue
             except aiohttp.ClientSSLError:
+                error_msg = TLS_ERROR
+                continue
+            except aiohttp.ClientConnectorError as e:
+                # DNS failures would fail the same way over http://
+                error_msg = "DNS error" if isinstance(e.os_error, socket.gaierror) else CONNECT_ERROR
                 continue
             except aiohttp.ClientError:
                 continue
             except Exception:
                 continue
 
-        return None, None, 0, "Failed to fetch"
+        return None, None, 0, error_msg
 
     async def fetch_and_analyze(self, session: aiohttp.ClientSession, domain: str) -> Dict:
         """Fetch homepage and analyze links for a single domain."""
@@ -161,50 +234,49 @@ class HomepageLinkAnalyzer:
         for url in urls_to_try:
             html, final_url, status, error = await self.fetch_with_retry(session, url)
 
+            # A timeout or HTTP error status on https:// won't be fixed by http://,
+            # which usually redirects straight back; only fall back when TLS/connect failed.
+            if not html and error not in HTTP_FALLBACK_ERRORS:
+                break
+
             if html and final_url:
                 try:
-                    soup = BeautifulSoup(html, 'html.parser')
-                    current_page_parsed = urlparse(final_url)
+                    tree = self.parse_html(html)
+                    current_page_parsed = urlsplit(final_url)
                     current_page_path = current_page_parsed.path
+                    base_hostname = (current_page_parsed.hostname or '').removeprefix('www.')
 
-                    all_links = soup.find_all('a', href=True)
-
-                    all_links_set = set()
-                    same_domain_links_set = set()
-                    same_domain_links_list = []
-                    all_links_list = []
-
-                    for link in all_links:
-                        href = link.get('href', '').strip()
+                    # Nav/footer links repeat a lot; only process each distinct href once
+                    unique_hrefs = dict.fromkeys(href.strip() for href in self.extract_hrefs(tree))
 
+                    # normalized URL -> its split form, first occurrence wins (stable dedup)
+                    normalized: Dict[str, SplitResult] = {}
+                    for href in unique_hrefs:
                         if not self.is_valid_link(href, current_page_path):
                             continue
 
-                        absolute_url = urljoin(final_url, href)
-                        normalized_url = self.normalize_url(absolute_url)
-
-                        if normalized_url not in all_links_set:
-                            all_links_set.add(normalized_url)
-                            all_links_list.append(normalized_url)
+                        split_url = urlsplit(urljoin(final_url, href))
+                        normalized.setdefault(self.normalize_url(split_url), split_url)
 
-                        if self.is_same_domain(final_url, absolute_url):
-                            if normalized_url not in same_domain_links_set:
-                                same_domain_links_set.add(normalized_url)
-                                same_domain_links_list.append(normalized_url)
+                    all_links_list = list(normalized)
+                    same_domain_links_list = [
+                        url for url, split_url in normalized.items()
+                        if self.is_same_domain(base_hostname, split_url)
+                    ]
 
                     total_links_count = len(all_links_list)
                     same_domain_count = len(same_domain_links_list)
 
                     notes = ''
-                    if self.detect_js_heavy_page(html, same_domain_count):
+                    if self.detect_js_heavy_page(html, tree, same_domain_count):
                         notes = 'Possible JS-heavy page, may not be fully rendered'
 
                     return {
                         'domain': domain,
                         'total_links': total_links_count,
                         'same_domain_links': same_domain_count,
-                        'all_links_array': json.dumps(all_links_list),
-                        'same_domain_links_array': json.dumps(same_domain_links_list),
+                        'all_links_array': dump_links(all_links_list),
+                        'same_domain_links_array': dump_links(same_domain_links_list),
                         'status': 'success',
                         'notes': notes
                     }
@@ -216,23 +288,38 @@ class HomepageLinkAnalyzer:
             'domain': domain,
             'total_links': 0,
             'same_domain_links': 0,
-            'all_links_array': json.dumps([]),
-            'same_domain_links_array': json.dumps([]),
+            'all_links_array': '[]',
+            'same_domain_links_array': '[]',
             'status': 'error',
             'notes': 'Failed to fetch or connection timeout'
         }
 
     async def process_domains(self, domains: List[str]):
         """Process all domains with concurrent limit."""
-        connector = aiohttp.TCPConnector(limit=self.max_concurrent, force_close=True)
-
-        async with aiohttp.ClientSession(connector=connector) as session:
+        # Keep connections alive so the http fallback / retries reuse them, and cache DNS
+        connector = aiohttp.TCPConnector(
+            limit=self.max_concurrent,
+            limit_per_host=2,
+            use_dns_cache=True,
+            ttl_dns_cache=300,
+            resolver=aiohttp.AsyncResolver() if aiodns is not None else None,
+            enable_cleanup_closed=True,
+            ssl=ssl.create_default_context(),  # one context, so TLS sessions can be resumed
+        )
+
+        async with aiohttp.ClientSession(connector=connector, headers=self.headers) as session:
             semaphore = asyncio.Semaphore(self.max_concurrent)
 
             async def bounded_fetch(domain: str):
                 async with semaphore:
                     result = await self.fetch_and_analyze(session, domain)
-                    self.results.append(result)
+                    # Synchronous write on the loop thread: rows can't interleave, no lock needed
+                    self._writer.writerow(result)
+                    self.results.append({
+                        'status': result['status'],
+                        'same_domain_links': result['same_domain_links'],
+                        'notes': result['notes'],
+                    })
                     self.completed_count += 1
 
                     # Progress indicator every 50 domains
@@ -245,13 +332,18 @@ class HomepageLinkAnalyzer:
             tasks = [bounded_fetch(domain) for domain in domains]
             await asyncio.gather(*tasks)
 
+    def open_results(self):
+        """Open the results CSV and write its header; rows are appended as domains complete."""
+        self._csv_file = open(self.output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20)
+        self._writer = csv.DictWriter(self._csv_file, fieldnames=CSV_FIELDNAMES)
+        self._writer.writeheader()
+
     def save_results(self):
-        """Save results to CSV."""
-        with open(self.output_path, 'w', newline='', encoding='utf-8') as f:
-            fieldnames = ['domain', 'total_links', 'same_domain_links', 'status', 'notes', 'same_domain_links_array', 'all_links_array']
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(self.results)
+        """Flush and close the results CSV."""
+        if self._csv_file is not None:
+            self._csv_file.close()
+            self._csv_file = None
+            self._writer = None
 
         print(f"\n✓ Results saved to: {self.output_path}")
 
@@ -263,7 +355,8 @@ class HomepageLinkAnalyzer:
             print("\nNo successful fetches to analyze.")
             return
 
-        same_domain_counts = [r['same_domain_links'] for r in successful]
+        counts = np.sort(np.fromiter((r['same_domain_links'] for r in successful), dtype=np.int64))
+        n = len(counts)
 
         print("\n" + "="*60)
         print("SUMMARY STATISTICS")
@@ -273,29 +366,20 @@ class HomepageLinkAnalyzer:
         print(f"Failed/timeout: {len(self.results) - len(successful)}")
         print()
         print(f"Same-domain links per homepage:")
-        print(f"  Min:    {min(same_domain_counts)}")
-        print(f"  Max:    {max(same_domain_counts)}")
-        print(f"  Mean:   {statistics.mean(same_domain_counts):.2f}")
-        print(f"  Median: {statistics.median(same_domain_counts):.2f}")
-
-        sorted_counts = sorted(same_domain_counts)
-        n = len(sorted_counts)
-        p25_idx = n // 4
-        p75_idx = 3 * n // 4
-        print(f"  P25:    {sorted_counts[p25_idx]}")
-        print(f"  P75:    {sorted_counts[p75_idx]}")
+        print(f"  Min:    {counts[0]}")
+        print(f"  Max:    {counts[-1]}")
+        print(f"  Mean:   {counts.mean():.2f}")
+        print(f"  Median: {np.median(counts):.2f}")
+        print(f"  P25:    {counts[n // 4]}")
+        print(f"  P75:    {counts[3 * n // 4]}")
 
         print("\nDistribution (histogram):")
-        bins = [0, 10, 20, 30, 50, 75, 100, 150, 200, float('inf')]
+        # Last edge is open-ended ("200+"): np.histogram closes the final bin on the right
+        bins = [0, 10, 20, 30, 50, 75, 100, 150, 200, max(int(counts[-1]), 200) + 1]
         bin_labels = ['0-9', '10-19', '20-29', '30-49', '50-74', '75-99', '100-149', '150-199', '200+']
 
-        histogram = {label: 0 for label in bin_labels}
-
-        for count in same_domain_counts:
-            for i in range(len(bins) - 1):
-                if bins[i] <= count < bins[i+1]:
-                    histogram[bin_labels[i]] += 1
-                    break
+        bin_counts, _ = np.histogram(counts, bins=bins)
+        histogram = dict(zip(bin_labels, bin_counts.tolist()))
 
         max_bar_length = 50
         max_count = max(histogram.values()) if histogram.values() else 1
@@ -321,8 +405,11 @@ class HomepageLinkAnalyzer:
         print(f"Found {len(domains)} domains to analyze")
         print(f"Settings: max {self.max_concurrent} concurrent, {self.timeout}s timeout, {self.max_retries} retries\n")
 
-        asyncio.run(self.process_domains(domains))
-        self.save_results()
+        self.open_results()
+        try:
+            (uvloop.run if uvloop is not None else asyncio.run)(self.process_domains(domains))
+        finally:
+            self.save_results()  # keeps partial results if the run is interrupted
         self.print_statistics()
 
 
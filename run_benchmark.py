@@ -177,7 +177,7 @@ def main():
     )
 
     # Save & print
-    runner.save_results(report, args.output_dir, args.output_format)
+    asyncio.run(runner.save_results(report, args.output_dir, args.output_format))
     print_summary(report)
 
 
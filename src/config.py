@@ -3,8 +3,22 @@ from dataclasses import dataclass
 from pathlib import Path
 from dotenv import load_dotenv
 
+from src.types import CrawlerType, LLMType
 
-@dataclass
+
+# Selected tool -> (Config attribute, env var) of the API key it requires.
+_REQUIRED_KEYS = {
+    CrawlerType.FIRECRAWL: ("firecrawl_api_key", "FIRECRAWL_API_KEY"),
+    CrawlerType.JINA: ("jina_api_key", "JINA_API_KEY"),
+    CrawlerType.SCRAPINGBEE: ("scrapingbee_api_key", "SCRAPINGBEE_API_KEY"),
+    CrawlerType.SCRAPERAPI: ("scraperapi_api_key", "SCRAPERAPI_API_KEY"),
+    LLMType.OPENAI: ("openai_api_key", "OPENAI_API_KEY"),
+    LLMType.CLAUDE: ("anthropic_api_key", "ANTHROPIC_API_KEY"),
+    LLMType.HAIKU: ("anthropic_api_key", "ANTHROPIC_API_KEY"),
+}
+
+
+@dataclass(slots=True)
 class Config:
     firecrawl_api_key: str = ""
     jina_api_key: str = ""
@@ -19,6 +33,9 @@ class Config:
     crawler_timeout: int = 60
     max_retries: int = 3
     min_delay_between_requests: float = 1.0  # Minimum delay (seconds) between requests to same domain
+    crawler_concurrency: int = 8  # Max pages fetched at once per domain crawl
+    llm_concurrency: int = 16  # Max LLM API calls in flight per extractor
+    combo_concurrency: int = 16  # Max cached crawler x LLM combos evaluated at once (llm-compare)
     log_level: str = "INFO"
 
     @classmethod
@@ -36,31 +53,21 @@ class Config:
             crawler_timeout=int(os.getenv("CRAWLER_TIMEOUT", "60")),
             max_retries=int(os.getenv("CRAWLER_MAX_RETRIES", "3")),
             min_delay_between_requests=float(os.getenv("MIN_DELAY_BETWEEN_REQUESTS", "1.0")),
+            crawler_concurrency=int(os.getenv("CRAWLER_CONCURRENCY", "8")),
+            llm_concurrency=int(os.getenv("LLM_CONCURRENCY", "16")),
+            combo_concurrency=int(os.getenv("COMBO_CONCURRENCY", "16")),
             log_level=os.getenv("LOG_LEVEL", "INFO"),
         )
 
     def validate(self, crawlers: list, llms: list):
         """Validate that required API keys are present for selected tools."""
         errors = []
-        from src.types import CrawlerType, LLMType
-
-        for c in crawlers:
-            if c == CrawlerType.FIRECRAWL and not self.firecrawl_api_key:
-                errors.append("FIRECRAWL_API_KEY required for firecrawl crawler")
-            if c == CrawlerType.JINA and not self.jina_api_key:
-                errors.append("JINA_API_KEY required for jina crawler")
-            if c == CrawlerType.SCRAPINGBEE and not self.scrapingbee_api_key:
-                errors.append("SCRAPINGBEE_API_KEY required for scrapingbee crawler")
-            if c == CrawlerType.SCRAPERAPI and not self.scraperapi_api_key:
-                errors.append("SCRAPERAPI_API_KEY required for scraperapi crawler")
 
-        for l in llms:
-            if l == LLMType.OPENAI and not self.openai_api_key:
-                errors.append("OPENAI_API_KEY required for openai LLM")
-            if l == LLMType.CLAUDE and not self.anthropic_api_key:
-                errors.append("ANTHROPIC_API_KEY required for claude LLM")
-            if l == LLMType.HAIKU and not self.anthropic_api_key:
-                errors.append("ANTHROPIC_API_KEY required for haiku LLM")
+        for kind, tools in (("crawler", crawlers), ("LLM", llms)):
+            for tool in tools:
+                required = _REQUIRED_KEYS.get(tool)
+                if required and not getattr(self, required[0]):
+                    errors.append(f"{required[1]} required for {tool.value} {kind}")
 
         if errors:
             raise ValueError("Missing API keys:\n  " + "\n  ".join(errors))
@@ -1,36 +1,224 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Iterable
-from urllib.parse import urljoin, urlparse, urldefrag
-from collections import defaultdict
+from typing import List, Optional, Dict, Iterator, Union
+from urllib.parse import ParseResult, urljoin, urlparse, urldefrag
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 import asyncio
+import hashlib
+import io
 import random
 import re
+import threading
+import time
+
+import aiohttp
+import lxml.html
+from lxml import etree
 
 from src.types import CrawlResult, CrawlerType
 
 
 DEFAULT_MAX_PAGES = 10
+# Bound discovery work on huge homepages. Generous enough that the homepage link
+# counts reported in CrawlResult are unaffected for ordinary sites.
+DISCOVERY_CHAR_CAP = 2_000_000
+DISCOVERY_LINK_CAP = 5_000
+# Discovery input larger than this is parsed in a worker thread to keep the loop responsive.
+DISCOVERY_OFFLOAD_CHARS = 200_000
+
+# What crawl_url_with_html hands to link discovery: the raw HTML, or the page's anchor
+# hrefs when the crawler has already parsed the HTML itself (saves a second parse).
+HtmlSource = Union[str, List[str]]
+
+# Raw HTML (local crawlers) is walked with lxml; markdown from API crawlers uses regexes.
+_HTML_DOC_PREFIXES = ("<!doctype", "<html", "<head", "<body", "<?xml", "<!--")
+_HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+_ANCHOR_HREFS = etree.XPath("//a/@href", smart_strings=False)
+_HREF_RE = re.compile(r'href\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
+_MD_LINK_RE = re.compile(r"\[[^\]]+\]\(([^)]+)\)")
+_MD_AUTOLINK_RE = re.compile(r"<(https?://[^>]+)>")
+
+
+def anchor_hrefs(tree: etree._Element) -> List[str]:
+    """All <a href> values of an already-parsed lxml HTML tree."""
+    return _ANCHOR_HREFS(tree)
+
+
+# Auth/sign-up pages and static assets are never worth crawling. The path tokens
+# (/login /log-in /signin /sign-in /signup /sign-up /register /auth /authenticate
+# /oauth /sso) are factored trie-style so each position is tested against a few
+# distinct first characters; "/auth" already covers "/authenticate".
+_SKIP_PATH_RE = re.compile(r"/(?:log-?in|sign-?(?:in|up)|register|o?auth|sso)")
+_SKIP_EXTS = frozenset({
+    "png", "jpg", "jpeg", "gif", "svg", "webp", "ico",
+    "css", "js", "json", "xml", "pdf", "zip", "rar",
+    "mp4", "mp3", "woff", "woff2", "ttf", "eot",
+})
+
+
+# URL helpers are module-level so lru_cache can share results across crawler
+# instances; discovery sees the same nav/footer URLs over and over.
+@lru_cache(maxsize=4096)
+def _parse_url(url: str) -> ParseResult:
+    return urlparse(url)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_host(host: str) -> str:
+    host = host.lower()
+    if host.startswith("www."):
+        return host[4:]
+    return host
+
+
+def _canonical_from_parsed(parsed: ParseResult) -> str:
+    path = parsed.path or "/"
+    if path != "/":
+        path = path.rstrip("/")
+    return f"{parsed.scheme}://{parsed.netloc}{path}"
+
+
+@lru_cache(maxsize=4096)
+def _canonical_url(url: str) -> str:
+    return _canonical_from_parsed(_parse_url(url))
+
+
+@lru_cache(maxsize=4096)
+def _page_name(url: str) -> str:
+    """Page key used in CrawlResult.page_contents: "homepage" or "/path[?query]"."""
+    parsed = _parse_url(url)
+    path = parsed.path or "/"
+    if path == "/":
+        return "homepage"
+    path = path.rstrip("/")
+    if not path.startswith("/"):
+        path = f"/{path}"
+    if parsed.query:
+        return f"{path}?{parsed.query}"
+    return path
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After header (delta-seconds or HTTP-date) -> seconds to wait."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass
+class _DomainState:
+    lock: asyncio.Lock
+    loop: asyncio.AbstractEventLoop  # loop the lock belongs to
+    last_request: float = 0.0  # time.monotonic() of the latest send slot taken
+
+
+# Rate-limiting state shared across all crawler instances, LRU-bounded so a long run
+# over many domains doesn't keep a lock per domain forever.
+_MAX_TRACKED_DOMAINS = 1024
+_domain_states: "OrderedDict[str, _DomainState]" = OrderedDict()
+
+
+def _get_domain_state(domain: str) -> _DomainState:
+    """Must be called from a coroutine: the lock is created for the running loop."""
+    loop = asyncio.get_running_loop()
+    state = _domain_states.get(domain)
+    if state is None:
+        state = _domain_states[domain] = _DomainState(lock=asyncio.Lock(), loop=loop)
+        if len(_domain_states) > _MAX_TRACKED_DOMAINS:
+            _domain_states.popitem(last=False)
+    else:
+        _domain_states.move_to_end(domain)
+        if state.loop is not loop:
+            # A new asyncio.run() (or test loop): a lock bound to the old loop would raise
+            state.lock = asyncio.Lock()
+            state.loop = loop
+    return state
+
+
+# (content digest, base) -> discovered (internal, external) links. Discovery is a pure
+# function of its input, so crawlers returning the same homepage content share the work.
+_MAX_CACHED_DISCOVERIES = 256
+_discovery_cache: "OrderedDict[tuple[str, str], tuple[List[str], List[str]]]" = OrderedDict()
+_discovery_cache_lock = threading.Lock()  # large pages are discovered in worker threads
+
+
+def _mentions_path(content: HtmlSource, path: str) -> bool:
+    """Cheap pre-discovery guess whether the homepage links to path."""
+    if isinstance(content, str):
+        return path in content
+    return any(path in href for href in content)
+
+
+def _content_digest(content: HtmlSource) -> str:
+    data = content if isinstance(content, str) else "\n".join(content)
+    return hashlib.blake2b(data.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+
+
+class CrawlHTTPError(Exception):
+    """Non-200 response from a crawler backend, with the server's Retry-After hint if any."""
+
+    def __init__(self, message: str, status: int, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
 
 
 class BaseCrawler(ABC):
     crawler_type: CrawlerType
 
-    # Class-level rate limiting state (shared across all crawler instances)
-    _domain_locks = defaultdict(asyncio.Lock)
-    _last_request_time = defaultdict(float)
-
-    def __init__(self, timeout: int = 60, max_retries: int = 3, min_delay: float = 1.0):
+    def __init__(
+        self, timeout: int = 60, max_retries: int = 3, min_delay: float = 1.0, concurrency: int = 8
+    ):
         self.timeout = timeout
         self.max_retries = max_retries
         self.min_delay = min_delay  # Minimum delay between requests to same domain
+        self.concurrency = max(1, concurrency)  # Max discovered pages fetched at once
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Pooled session shared by all requests of this crawler (created lazily inside the loop)."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=32, limit_per_host=8, ttl_dns_cache=300, keepalive_timeout=60
+                )
+            )
+        return self._session
+
+    @staticmethod
+    async def _http_error(label: str, resp: aiohttp.ClientResponse) -> CrawlHTTPError:
+        text = await resp.text()
+        return CrawlHTTPError(
+            f"{label} HTTP {resp.status}: {text[:200]}",
+            status=resp.status,
+            retry_after=_parse_retry_after(resp.headers.get("Retry-After")),
+        )
+
+    async def close(self):
+        """Release the pooled HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     @abstractmethod
     async def crawl_url(self, url: str) -> str:
         """Crawl a single URL, return markdown/text content."""
         ...
 
-    async def crawl_url_with_html(self, url: str) -> tuple[str, Optional[str]]:
-        """Crawl a single URL, returning (content, raw_html if available)."""
+    async def crawl_url_with_html(self, url: str) -> tuple[str, Optional[HtmlSource]]:
+        """Crawl a single URL, returning (content, raw_html or its hrefs if available)."""
         return await self.crawl_url(url), None
 
     async def crawl(
@@ -40,9 +228,6 @@ class BaseCrawler(ABC):
         max_pages: int = DEFAULT_MAX_PAGES,
     ) -> CrawlResult:
         """Crawl a domain: homepage first, then discover and crawl internal links."""
-        import time
-        from datetime import datetime
-
         page_contents: Dict[str, str] = {}
         errors = []
         start = time.time()
@@ -57,37 +242,94 @@ class BaseCrawler(ABC):
             homepage_content = ""
             homepage_html = None
 
-        # 2) Discover internal/external links from homepage (prefer raw HTML if available)
+        # 2) Discover internal/external links from homepage (prefer raw HTML if available).
+        #    Pricing/about pages the homepage visibly links to are fetched optimistically
+        #    meanwhile, so their requests overlap discovery; big pages are parsed off-loop.
         discovery_source = homepage_html or homepage_content
-        discovered, external_links = self._discover_links(discovery_source, base)
-        # Prefer pricing/about if they appear on the homepage
-        preferred = [urljoin(base + "/", "pricing"), urljoin(base + "/", "about")]
-        discovered_set = {self._canonical_url(u) for u in discovered}
-        ordered = []
-        for url in preferred:
-            if self._canonical_url(url) in discovered_set:
-                ordered.append(url)
-        for url in discovered:
-            if url not in ordered:
-                ordered.append(url)
-        discovered = ordered
-        if pages:
-            discovered = self._filter_by_pages(discovered, pages) or discovered
-        if max_pages is not None:
-            discovered = discovered[: max(0, max_pages)]
-
-        # 3) Crawl each discovered page
-        for url in discovered:
-            page_name = self._page_name(url, base)
-            if page_name in page_contents:
-                continue
-            content = await self._crawl_with_retries(page_name, url, errors)
-            if content and content.strip():
+        base_slash = base + "/"
+        preferred = [urljoin(base_slash, "pricing"), urljoin(base_slash, "about")]
+        # Bounds every page request of this crawl, optimistic prefetches included
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def fetch_page(page_name: str, url: str, page_errors: List[str]) -> str:
+            async with semaphore:
+                return await self._crawl_with_retries(page_name, url, page_errors)
+
+        prefetched: Dict[str, tuple[asyncio.Task, List[str]]] = {}
+        if discovery_source and not pages and (max_pages is None or max_pages > 0):
+            for url in preferred:
+                if _mentions_path(discovery_source, _parse_url(url).path):
+                    page_errors: List[str] = []
+                    task = asyncio.create_task(fetch_page(_page_name(url), url, page_errors))
+                    prefetched[url] = (task, page_errors)
+        try:
+            if isinstance(discovery_source, str) and len(discovery_source) > DISCOVERY_OFFLOAD_CHARS:
+                discovered, external_links = await asyncio.to_thread(
+                    self._discover_links, discovery_source, base
+                )
+            else:
+                discovered, external_links = self._discover_links(discovery_source, base)
+            # Prefer pricing/about if they appear on the homepage
+            discovered_set = {_canonical_url(u) for u in discovered}
+            ordered = [url for url in preferred if _canonical_url(url) in discovered_set]
+            ordered_set = set(ordered)
+            ordered.extend(url for url in discovered if url not in ordered_set)
+            discovered = ordered
+            if pages:
+                discovered = self._filter_by_pages(discovered, pages) or discovered
+            if max_pages is not None:
+                discovered = discovered[: max(0, max_pages)]
+
+            # 3) Crawl discovered pages concurrently (local crawlers are still spaced by the
+            #    per-domain rate limiter). URLs mapping to the same page name are tried in order.
+            candidates: Dict[str, List[str]] = {}
+            for url in discovered:
+                page_name = self._page_name(url, base)
+                if page_name not in page_contents:
+                    candidates.setdefault(page_name, []).append(url)
+
+            async def crawl_page(page_name: str, urls: List[str]) -> str:
+                # The semaphore is taken per request, not per page: awaiting a prefetch
+                # while holding a slot could deadlock it at concurrency=1
+                for url in urls:
+                    if url in prefetched:
+                        task, page_errors = prefetched.pop(url)
+                        content = await task
+                        errors.extend(page_errors)
+                    else:
+                        content = await fetch_page(page_name, url, errors)
+                    if content and content.strip():
+                        return content
+                return ""
+
+            # Drop optimistic fetches that discovery didn't confirm (before awaiting anything)
+            wanted = {url for urls in candidates.values() for url in urls}
+            for url in [u for u in prefetched if u not in wanted]:
+                prefetched.pop(url)[0].cancel()
+
+            crawled = await asyncio.gather(
+                *(crawl_page(name, urls) for name, urls in candidates.items()),
+                return_exceptions=True,
+            )
+        finally:
+            for task, _ in prefetched.values():
+                task.cancel()
+        for page_name, content in zip(candidates, crawled):
+            if isinstance(content, Exception):
+                errors.append(f"{page_name}: {content}")
+            elif content:
                 page_contents[page_name] = content
 
-        combined = "\n\n---\n\n".join(
-            f"## Page: {name}\n\n{text}" for name, text in page_contents.items()
-        )
+        buf = io.StringIO()
+        sep = ""
+        for name, text in page_contents.items():
+            buf.write(sep)
+            buf.write("## Page: ")
+            buf.write(name)
+            buf.write("\n\n")
+            buf.write(text)
+            sep = "\n\n---\n\n"
+        combined = buf.getvalue()
 
         return CrawlResult(
             domain=domain,
@@ -111,7 +353,7 @@ class BaseCrawler(ABC):
         """Only local crawlers provide raw HTML for link discovery."""
         return self._should_rate_limit()
 
-    async def _crawl_homepage(self, base: str, errors: List[str]) -> tuple[str, Optional[str]]:
+    async def _crawl_homepage(self, base: str, errors: List[str]) -> tuple[str, Optional[HtmlSource]]:
         if self._use_raw_html_for_discovery():
             return await self._crawl_with_retries_with_html("homepage", base, errors)
         return await self._crawl_with_retries("homepage", base, errors), None
@@ -124,39 +366,34 @@ class BaseCrawler(ABC):
 
     async def _crawl_with_retries_with_html(
         self, page_name: str, url: str, errors: List[str]
-    ) -> tuple[str, Optional[str]]:
+    ) -> tuple[str, Optional[HtmlSource]]:
         return await self._crawl_with_retries_impl(
             page_name, url, errors, use_html=True
         )
 
     async def _crawl_with_retries_impl(
         self, page_name: str, url: str, errors: List[str], use_html: bool
-    ) -> tuple[str, Optional[str]]:
-        import time
-
-        domain = urlparse(url).netloc
+    ) -> tuple[str, Optional[HtmlSource]]:
+        domain = _parse_url(url).netloc
 
         for attempt in range(self.max_retries):
             try:
-                # Apply rate limiting only for local crawlers
+                # Apply rate limiting only for local crawlers. The lock covers the spacing wait
+                # and taking the send slot; the request itself runs outside it so fetches can
+                # overlap. The slot is taken only after the wait, so a fetch cancelled while
+                # waiting doesn't push back the requests queued behind it.
                 if self._should_rate_limit():
-                    async with self._domain_locks[domain]:
-                        elapsed = time.time() - self._last_request_time[domain]
-                        if elapsed < self.min_delay:
-                            wait = self.min_delay - elapsed
-                            wait += random.uniform(-0.2 * wait, 0.2 * wait)
-                            await asyncio.sleep(max(0, wait))
-
-                        self._last_request_time[domain] = time.time()
-                        if use_html:
-                            result = await self.crawl_url_with_html(url)
-                        else:
-                            result = (await self.crawl_url(url), None)
+                    state = _get_domain_state(domain)
+                    async with state.lock:
+                        wait = self.min_delay - (time.monotonic() - state.last_request)
+                        if wait > 0:
+                            await asyncio.sleep(max(0.0, wait + random.uniform(-0.2 * wait, 0.2 * wait)))
+                        state.last_request = time.monotonic()
+
+                if use_html:
+                    result = await self.crawl_url_with_html(url)
                 else:
-                    if use_html:
-                        result = await self.crawl_url_with_html(url)
-                    else:
-                        result = (await self.crawl_url(url), None)
+                    result = (await self.crawl_url(url), None)
 
                 return result
 
@@ -164,8 +401,12 @@ class BaseCrawler(ABC):
                 error_str = str(e)
 
                 if attempt < self.max_retries - 1 and any(code in error_str for code in ["429", "403", "503"]):
-                    backoff = 2 ** attempt
-                    await asyncio.sleep(backoff)
+                    # Prefer the server's Retry-After; otherwise full jitter so concurrent
+                    # page fetches don't retry in lockstep. Never wait longer than the timeout.
+                    backoff = getattr(e, "retry_after", None)
+                    if backoff is None:
+                        backoff = random.uniform(0, min(2 ** attempt, 30))
+                    await asyncio.sleep(min(backoff, self.timeout))
                     continue
 
                 if attempt == self.max_retries - 1:
@@ -180,62 +421,63 @@ class BaseCrawler(ABC):
         return base
 
     def _page_name(self, url: str, base: str) -> str:
-        parsed = urlparse(url)
-        path = parsed.path or "/"
-        if path == "/":
-            return "homepage"
-        path = path.rstrip("/")
-        if not path.startswith("/"):
-            path = f"/{path}"
-        if parsed.query:
-            return f"{path}?{parsed.query}"
-        return path
+        return _page_name(url)
 
     def _filter_by_pages(self, urls: List[str], pages: List[str]) -> List[str]:
         wanted = {p.strip("/").lower() for p in pages if p}
         filtered = []
         for url in urls:
-            path = urlparse(url).path.strip("/").lower()
+            path = _parse_url(url).path.strip("/").lower()
             if path in wanted:
                 filtered.append(url)
         return filtered
 
-    def _discover_links(self, content: str, base: str) -> tuple[List[str], List[str]]:
+    def _discover_links(self, content: HtmlSource, base: str) -> tuple[List[str], List[str]]:
         if not content:
             return [], []
-        base_parsed = urlparse(base)
-        base_host = self._normalize_host(base_parsed.netloc)
-        skip_path_tokens = (
-            "/login", "/log-in", "/signin", "/sign-in", "/signup", "/sign-up",
-            "/register", "/auth", "/authenticate", "/oauth", "/sso",
-        )
-        skip_exts = {
-            ".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp", ".ico",
-            ".css", ".js", ".json", ".xml", ".pdf", ".zip", ".rar",
-            ".mp4", ".mp3", ".woff", ".woff2", ".ttf", ".eot",
-        }
-
-        raw_links = self._extract_links_from_content(content)
+        key = (("html:" if isinstance(content, str) else "hrefs:") + _content_digest(content), base)
+        with _discovery_cache_lock:
+            cached = _discovery_cache.get(key)
+            if cached is not None:
+                _discovery_cache.move_to_end(key)
+        if cached is None:
+            cached = self._discover_links_uncached(content, base)
+            with _discovery_cache_lock:
+                _discovery_cache[key] = cached
+                if len(_discovery_cache) > _MAX_CACHED_DISCOVERIES:
+                    _discovery_cache.popitem(last=False)
+        internal, external = cached
+        return list(internal), list(external)
+
+    def _discover_links_uncached(self, content: HtmlSource, base: str) -> tuple[List[str], List[str]]:
+        base_parsed = _parse_url(base)
+        base_host = _normalize_host(base_parsed.netloc)
+        base_canonical = _canonical_from_parsed(base_parsed)
+
+        raw_links = self._extract_links_from_content(content[:DISCOVERY_CHAR_CAP])
         seen = set()
         internal = []
         external = []
         for raw in raw_links:
+            if len(seen) >= DISCOVERY_LINK_CAP:
+                break
             cleaned = raw.strip()
             if not cleaned or cleaned.startswith(("#", "mailto:", "tel:", "javascript:", "data:")):
                 continue
             absolute = urljoin(base, cleaned)
             absolute, _ = urldefrag(absolute)
-            parsed = urlparse(absolute)
+            parsed = _parse_url(absolute)
             if parsed.scheme not in ("http", "https") or not parsed.netloc:
                 continue
             path_lower = parsed.path.lower()
-            if any(token in path_lower for token in skip_path_tokens):
+            if _SKIP_PATH_RE.search(path_lower):
                 continue
-            if any(path_lower.endswith(ext) for ext in skip_exts):
+            _, dot, ext = path_lower.rpartition(".")
+            if dot and ext in _SKIP_EXTS:
                 continue
-            host = self._normalize_host(parsed.netloc)
-            canonical = self._canonical_url(absolute)
-            if canonical == self._canonical_url(base):
+            host = _normalize_host(parsed.netloc)
+            canonical = _canonical_from_parsed(parsed)
+            if canonical == base_canonical:
                 continue
             if canonical in seen:
                 continue
@@ -247,33 +489,28 @@ class BaseCrawler(ABC):
         return internal, external
 
     def _normalize_host(self, host: str) -> str:
-        host = host.lower()
-        if host.startswith("www."):
-            return host[4:]
-        return host
+        return _normalize_host(host)
 
     def _canonical_url(self, url: str) -> str:
-        parsed = urlparse(url)
-        path = parsed.path or "/"
-        if path != "/":
-            path = path.rstrip("/")
-        return f"{parsed.scheme}://{parsed.netloc}{path}"
-
-    def _extract_links_from_content(self, content: str) -> Iterable[str]:
-        links = []
+        return _canonical_url(url)
+
+    def _extract_links_from_content(self, content: HtmlSource) -> Iterator[str]:
+        """Yield raw link targets lazily so discovery can stop early."""
+        if isinstance(content, list):  # hrefs already pulled from a parsed page
+            yield from content
+            return
+        if content.lstrip()[:9].lower().startswith(_HTML_DOC_PREFIXES):
+            try:
+                tree = lxml.html.fromstring(content.encode("utf-8"), parser=_HTML_PARSER)
+            except (etree.ParserError, ValueError):
+                pass  # not parseable as HTML; fall back to the regexes below
+            else:
+                yield from _ANCHOR_HREFS(tree)
+                return
+
         # HTML href links
-        links.extend(
-            m.group(1)
-            for m in re.finditer(r'href\s*=\s*["\']([^"\']+)["\']', content, flags=re.IGNORECASE)
-        )
+        yield from (m.group(1) for m in _HREF_RE.finditer(content))
         # Markdown inline links [text](url)
-        links.extend(
-            m.group(1)
-            for m in re.finditer(r"\[[^\]]+\]\(([^)]+)\)", content)
-        )
+        yield from (m.group(1) for m in _MD_LINK_RE.finditer(content))
         # Markdown autolinks <http://...>
-        links.extend(
-            m.group(1)
-            for m in re.finditer(r"<(https?://[^>]+)>", content)
-        )
-        return links
+        yield from (m.group(1) for m in _MD_AUTOLINK_RE.finditer(content))
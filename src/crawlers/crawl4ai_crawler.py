@@ -30,3 +30,4 @@ class Crawl4AICrawler(BaseCrawler):
         if self._crawler:
             await self._crawler.close()
             self._crawler = None
+        await super().close()
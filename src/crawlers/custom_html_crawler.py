@@ -1,10 +1,22 @@
 import asyncio
+from importlib.util import find_spec
+from typing import List, Optional
+
 import aiohttp
 import trafilatura
+from trafilatura.utils import load_html
 
-from src.crawlers.base import BaseCrawler
+from src.crawlers.base import BaseCrawler, anchor_hrefs
 from src.types import CrawlerType
 
+# aiohttp decodes Brotli only if a brotli binding is importable; otherwise a "br" body
+# would fail to decode, so only advertise it when we can handle it.
+ACCEPT_ENCODING = (
+    "gzip, deflate, br"
+    if find_spec("brotli") or find_spec("brotlicffi")
+    else "gzip, deflate"
+)
+
 
 class CustomHTMLCrawler(BaseCrawler):
     """
@@ -22,7 +34,7 @@ class CustomHTMLCrawler(BaseCrawler):
                           "Chrome/120.0.0.0 Safari/537.36",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.5",
-            "Accept-Encoding": "gzip, deflate, br",
+            "Accept-Encoding": ACCEPT_ENCODING,
             "DNT": "1",
             "Connection": "keep-alive",
             "Upgrade-Insecure-Requests": "1",
@@ -32,23 +44,37 @@ class CustomHTMLCrawler(BaseCrawler):
         content, _ = await self.crawl_url_with_html(url)
         return content
 
-    async def crawl_url_with_html(self, url: str) -> tuple[str, str]:
-        async with aiohttp.ClientSession() as session:
-            html = await self._fetch_with_retry(session, url)
-            extracted = trafilatura.extract(
-                html,
-                output_format="markdown",
-                include_images=False,        # Drop image markdown
-                include_comments=False,      # Exclude user comments
-                include_tables=True,         # Important for pricing tables
-                include_links=True,          # Keep links for context
-                deduplicate=True,            # Remove duplicate content
-                favor_recall=True,           # Prefer capturing more content
-                no_fallback=False,           # Use fallback extraction if needed
-            )
-            if not extracted:
-                raise Exception("CustomHTML extraction returned empty content")
-            return extracted, html
+    async def crawl_url_with_html(self, url: str) -> tuple[str, List[str]]:
+        session = await self._get_session()
+        html = await self._fetch_with_retry(session, url)
+        # Parse once with trafilatura's own loader; the tree feeds both extraction and
+        # link discovery. hrefs are read first since extraction may prune the tree.
+        tree = load_html(html)
+        if tree is None:
+            raise Exception("CustomHTML could not parse page HTML")
+        hrefs = anchor_hrefs(tree)
+        extracted = trafilatura.extract(
+            tree,
+            output_format="markdown",
+            include_images=False,        # Drop image markdown
+            include_comments=False,      # Exclude user comments
+            include_tables=True,         # Important for pricing tables
+            include_links=True,          # Keep links for context
+            deduplicate=True,            # Remove duplicate content
+            favor_recall=True,           # Prefer capturing more content
+            no_fallback=False,           # Use fallback extraction if needed
+        )
+        if not extracted:
+            raise Exception("CustomHTML extraction returned empty content")
+        return extracted, hrefs
+
+    @staticmethod
+    def _decode(raw: bytes, charset: Optional[str]) -> str:
+        """Decode with the declared charset (UTF-8 if none), skipping aiohttp's charset sniffing."""
+        try:
+            return raw.decode(charset or "utf-8", errors="replace")
+        except LookupError:  # unknown charset label
+            return raw.decode("utf-8", errors="replace")
 
     async def _fetch_with_retry(self, session: aiohttp.ClientSession, url: str) -> str:
         for attempt in range(self.max_retries):
@@ -62,7 +88,7 @@ class CustomHTMLCrawler(BaseCrawler):
                     ssl=ssl_context,
                 ) as response:
                     if response.status == 200:
-                        return await response.text()
+                        return self._decode(await response.read(), response.charset)
                     if response.status in (403, 429):
                         await asyncio.sleep(3)
             except asyncio.TimeoutError:
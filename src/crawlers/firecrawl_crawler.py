@@ -1,4 +1,6 @@
 import aiohttp
+
+from src import jsonio
 from src.crawlers.base import BaseCrawler
 from src.types import CrawlerType
 
@@ -12,23 +14,22 @@ class FirecrawlCrawler(BaseCrawler):
         self.api_url = "https://api.firecrawl.dev/v1/scrape"
 
     async def crawl_url(self, url: str) -> str:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                self.api_url,
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "url": url,
-                    "formats": ["markdown"],
-                    "excludeTags": ["img"],
-                    "removeBase64Images": True,
-                },
-                timeout=aiohttp.ClientTimeout(total=self.timeout),
-            ) as resp:
-                if resp.status != 200:
-                    text = await resp.text()
-                    raise Exception(f"Firecrawl HTTP {resp.status}: {text[:200]}")
-                data = await resp.json()
-                return data.get("data", {}).get("markdown", "")
+        session = await self._get_session()
+        async with session.post(
+            self.api_url,
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+            },
+            json={
+                "url": url,
+                "formats": ["markdown"],
+                "excludeTags": ["img"],
+                "removeBase64Images": True,
+            },
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        ) as resp:
+            if resp.status != 200:
+                raise await self._http_error("Firecrawl", resp)
+            data = jsonio.loads(await resp.read())
+            return data.get("data", {}).get("markdown", "")
@@ -17,13 +17,12 @@ class JinaReaderCrawler(BaseCrawler):
             "Accept": "text/markdown",
             "X-Return-Format": "markdown",
         }
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                reader_url,
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=self.timeout),
-            ) as resp:
-                if resp.status != 200:
-                    text = await resp.text()
-                    raise Exception(f"Jina HTTP {resp.status}: {text[:200]}")
-                return await resp.text()
+        session = await self._get_session()
+        async with session.get(
+            reader_url,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        ) as resp:
+            if resp.status != 200:
+                raise await self._http_error("Jina", resp)
+            return await resp.text()
@@ -1,54 +1,45 @@
+import importlib
+from typing import Dict, Optional, Tuple, Type, Union
+
 from src.types import CrawlerType
 from src.crawlers.base import BaseCrawler
 from src.config import Config
+# aiohttp-only crawlers are cheap to import; trafilatura/crawl4ai-backed ones stay lazy below
+from src.crawlers.firecrawl_crawler import FirecrawlCrawler
+from src.crawlers.jina_crawler import JinaReaderCrawler
+from src.crawlers.scraperapi_crawler import ScraperAPICrawler
+
+
+# Crawler type -> (class, or "module:Class" imported on first use; Config attribute of its API key)
+_CRAWLERS: Dict[CrawlerType, Tuple[Union[Type[BaseCrawler], str], Optional[str]]] = {
+    CrawlerType.FIRECRAWL: (FirecrawlCrawler, "firecrawl_api_key"),
+    CrawlerType.CRAWL4AI: ("src.crawlers.crawl4ai_crawler:Crawl4AICrawler", None),
+    CrawlerType.JINA: (JinaReaderCrawler, "jina_api_key"),
+    CrawlerType.SCRAPINGBEE: ("src.crawlers.scrapingbee_crawler:ScrapingBeeCrawler", "scrapingbee_api_key"),
+    CrawlerType.SCRAPERAPI: (ScraperAPICrawler, "scraperapi_api_key"),
+    CrawlerType.CUSTOM_HTML: ("src.crawlers.custom_html_crawler:CustomHTMLCrawler", None),
+}
+
+
+def _resolve(crawler_type: CrawlerType) -> Tuple[Type[BaseCrawler], Optional[str]]:
+    cls, api_key_attr = _CRAWLERS[crawler_type]
+    if isinstance(cls, str):
+        module_name, _, class_name = cls.partition(":")
+        cls = getattr(importlib.import_module(module_name), class_name)
+        _CRAWLERS[crawler_type] = (cls, api_key_attr)
+    return cls, api_key_attr
 
 
 def get_crawler(crawler_type: CrawlerType, config: Config) -> BaseCrawler:
-    if crawler_type == CrawlerType.FIRECRAWL:
-        from src.crawlers.firecrawl_crawler import FirecrawlCrawler
-        return FirecrawlCrawler(
-            api_key=config.firecrawl_api_key,
-            timeout=config.crawler_timeout,
-            max_retries=config.max_retries,
-            min_delay=config.min_delay_between_requests,
-        )
-    elif crawler_type == CrawlerType.CRAWL4AI:
-        from src.crawlers.crawl4ai_crawler import Crawl4AICrawler
-        return Crawl4AICrawler(
-            timeout=config.crawler_timeout,
-            max_retries=config.max_retries,
-            min_delay=config.min_delay_between_requests,
-        )
-    elif crawler_type == CrawlerType.JINA:
-        from src.crawlers.jina_crawler import JinaReaderCrawler
-        return JinaReaderCrawler(
-            api_key=config.jina_api_key,
-            timeout=config.crawler_timeout,
-            max_retries=config.max_retries,
-            min_delay=config.min_delay_between_requests,
-        )
-    elif crawler_type == CrawlerType.SCRAPINGBEE:
-        from src.crawlers.scrapingbee_crawler import ScrapingBeeCrawler
-        return ScrapingBeeCrawler(
-            api_key=config.scrapingbee_api_key,
-            timeout=config.crawler_timeout,
-            max_retries=config.max_retries,
-            min_delay=config.min_delay_between_requests,
-        )
-    elif crawler_type == CrawlerType.SCRAPERAPI:
-        from src.crawlers.scraperapi_crawler import ScraperAPICrawler
-        return ScraperAPICrawler(
-            api_key=config.scraperapi_api_key,
-            timeout=config.crawler_timeout,
-            max_retries=config.max_retries,
-            min_delay=config.min_delay_between_requests,
-        )
-    elif crawler_type == CrawlerType.CUSTOM_HTML:
-        from src.crawlers.custom_html_crawler import CustomHTMLCrawler
-        return CustomHTMLCrawler(
-            timeout=config.crawler_timeout,
-            max_retries=config.max_retries,
-            min_delay=config.min_delay_between_requests,
-        )
-    else:
-        raise ValueError(f"Unknown crawler type: {crawler_type}")
+    try:
+        cls, api_key_attr = _resolve(crawler_type)
+    except KeyError:
+        raise ValueError(f"Unknown crawler type: {crawler_type}") from None
+    kwargs = {"api_key": getattr(config, api_key_attr)} if api_key_attr else {}
+    return cls(
+        timeout=config.crawler_timeout,
+        max_retries=config.max_retries,
+        min_delay=config.min_delay_between_requests,
+        concurrency=config.crawler_concurrency,
+        **kwargs,
+    )
@@ -20,13 +20,12 @@ class ScraperAPICrawler(BaseCrawler):
             "output_format": "markdown",
             "render": "true" if self.render_js else "false",
         }
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                self.api_url,
-                params=params,
-                timeout=aiohttp.ClientTimeout(total=self.timeout),
-            ) as resp:
-                if resp.status != 200:
-                    text = await resp.text()
-                    raise Exception(f"ScraperAPI HTTP {resp.status}: {text[:200]}")
-                return await resp.text()
+        session = await self._get_session()
+        async with session.get(
+            self.api_url,
+            params=params,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        ) as resp:
+            if resp.status != 200:
+                raise await self._http_error("ScraperAPI", resp)
+            return await resp.text()
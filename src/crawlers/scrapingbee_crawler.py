@@ -20,22 +20,21 @@ class ScrapingBeeCrawler(BaseCrawler):
             "url": url,
             "render_js": "true" if self.render_js else "false",
         }
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                self.api_url,
-                params=params,
-                timeout=aiohttp.ClientTimeout(total=self.timeout),
-            ) as resp:
-                if resp.status != 200:
-                    text = await resp.text()
-                    raise Exception(f"ScrapingBee HTTP {resp.status}: {text[:200]}")
-                html = await resp.text()
-                extracted = trafilatura.extract(
-                    html,
-                    output_format="markdown",
-                    include_images=False,
-                    include_links=True,
-                )
-                if not extracted:
-                    raise Exception("ScrapingBee returned empty content after extraction")
-                return extracted
+        session = await self._get_session()
+        async with session.get(
+            self.api_url,
+            params=params,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        ) as resp:
+            if resp.status != 200:
+                raise await self._http_error("ScrapingBee", resp)
+            html = await resp.text()
+            extracted = trafilatura.extract(
+                html,
+                output_format="markdown",
+                include_images=False,
+                include_links=True,
+            )
+            if not extracted:
+                raise Exception("ScrapingBee returned empty content after extraction")
+            return extracted
@@ -1,42 +1,138 @@
-import json
+import os
+import pickle
 import re
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
+from src import jsonio
 from src.types import (
     ExtractedFeatures, EvaluationResult, FeatureScore, PresenceScore,
 )
 from src.models import (
-    FEATURES, FEATURE_TYPES, FeatureType,
+    FEATURES, FEATURE_TYPES, FEATURE_TYPES_TUPLE, FeatureType,
     GT_FIELD_MAP, GT_INVERTED_BOOLEANS,
 )
 
 
+_WORD_RE = re.compile(r'\w+')
+# ASCII byte -> itself if it is a \w character, else space. For ASCII text,
+# translate + split yields exactly the _WORD_RE tokens, several times faster.
+_ASCII_WORD_BYTES = bytes(
+    c if chr(c).isalnum() or c == 0x5F else 0x20 for c in range(128)
+) + bytes(range(128, 256))
+_JSON_SPLIT_RE = re.compile(r'(?=\{"company")')
+# Exact yes/no spellings seen in GT, already lowercased and stripped
+_BOOL_NORM = {"yes": "true", "true": "true", "1": "true", "no": "false", "false": "false", "0": "false"}
+
+
+@lru_cache(maxsize=4096)
+def _normalize_domain(domain: str) -> str:
+    # Strip scheme and www. as prefixes only: a "www." inside the host is part of the name
+    return domain.removeprefix("https://").removeprefix("http://").removeprefix("www.").rstrip("/")
+
+
+def _words(text: str) -> list:
+    """\\w+ tokens of text."""
+    if text.isascii():
+        return text.encode().translate(_ASCII_WORD_BYTES).decode().split()
+    return _WORD_RE.findall(text)
+
+
+# GT values recur for every crawler/LLM pair, so their normalized forms are memoized
+@lru_cache(maxsize=4096)
+def _norm(value: str) -> str:
+    return value.lower().strip()
+
+
+@lru_cache(maxsize=4096)
+def _word_set(text: str) -> frozenset:
+    return frozenset(_words(text))
+
+
+@lru_cache(maxsize=4096)
+def _split_list_str(val: str) -> tuple:
+    """Comma-separated list -> lowercase items; GT strings repeat for every crawler/LLM pair."""
+    return tuple(s for item in val.split(",") if (s := item.strip().lower()))
+
+
+_N_FEATURES = len(FEATURES)
+# (score, match_type) for presence agreement / disagreement
+_PRESENCE_MATCH = (1.0, "exact")
+_PRESENCE_MISMATCH = (0.0, "mismatch")
+
+
 class GroundTruthComparator:
-    def __init__(self, ground_truth_path: Path):
-        self.ground_truth = self._load_jsonl(ground_truth_path)
+    def __init__(self, ground_truth_path: Path, use_cache: bool = True):
+        path = Path(ground_truth_path)
+        self.ground_truth = self._load_cached(path) if use_cache else self._load_jsonl(path)
         self._index = self._build_index()
+        # new feature name -> old GT field names that map to it (GT_FIELD_MAP order kept)
+        self._new_to_old: Dict[str, List[str]] = {}
+        for old_name, new_name in GT_FIELD_MAP.items():
+            self._new_to_old.setdefault(new_name, []).append(old_name)
+        # new feature name -> GT keys to try in order, each with whether it is an old name
+        self._gt_key_variants: Dict[str, tuple] = {}
+        for feat_name in FEATURES:
+            keys: Dict[str, bool] = {}
+            for old_name in self._new_to_old.get(feat_name, ()):
+                for key in (old_name, old_name.replace("_", " "), old_name.replace(" ", "_")):
+                    keys.setdefault(key, True)
+            keys.setdefault(feat_name, False)
+            self._gt_key_variants[feat_name] = tuple(keys.items())
+        # GT depends only on the domain, so normalize it once per domain
+        self._normalized_cache: Dict[str, Optional[Dict[str, Dict[str, Any]]]] = {}
+        self._gt_values_cache: Dict[str, Optional[Dict[str, Any]]] = {}
+        # (feature, type-specific scorer) resolved once instead of per feature per evaluate()
+        self._feat_dispatch = [
+            (feat_name, self._scorer_for(feat_name, feat_type))
+            for feat_name, feat_type in zip(FEATURES, FEATURE_TYPES_TUPLE)
+        ]
 
     def get_normalized_ground_truth(self, domain: str) -> Optional[Dict[str, Dict[str, Any]]]:
         """Return normalized GT map: feature -> {present: bool, value: any}."""
-        gt = self._find_ground_truth(domain)
-        if not gt:
+        normalized = self._normalized_ground_truth(domain)
+        if normalized is None:
             return None
-        gt_features = gt.get("features", {})
-        normalized: Dict[str, Dict[str, Any]] = {}
-        for feat_name in FEATURES:
-            gt_feat, used_old_name = self._get_gt_feature(gt_features, feat_name)
-            gt_present = gt_feat.get("present", False) if gt_feat else False
-            gt_val = (
-                self._normalize_gt_value(feat_name, gt_feat, used_old_name)
-                if gt_present else None
-            )
-            normalized[feat_name] = {"present": gt_present, "value": gt_val}
+        return {feat_name: dict(entry) for feat_name, entry in normalized.items()}
+
+    def _normalized_ground_truth(self, domain: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Cached, shared version of get_normalized_ground_truth; do not mutate the result."""
+        key = _normalize_domain(domain)
+        if key in self._normalized_cache:
+            return self._normalized_cache[key]
+        gt = self._index.get(key)
+        normalized: Optional[Dict[str, Dict[str, Any]]] = None
+        if gt:
+            gt_features = gt.get("features", {})
+            normalized = {}
+            for feat_name in FEATURES:
+                gt_feat, used_old_name = self._get_gt_feature(gt_features, feat_name)
+                gt_present = gt_feat.get("present", False) if gt_feat else False
+                gt_val = (
+                    self._normalize_gt_value(feat_name, gt_feat, used_old_name)
+                    if gt_present else None
+                )
+                normalized[feat_name] = {"present": gt_present, "value": gt_val}
+        self._normalized_cache[key] = normalized
         return normalized
 
+    def get_ground_truth_values(self, domain: str) -> Optional[Dict[str, Any]]:
+        """Return feature -> normalized GT value, shared per domain; do not mutate the result."""
+        key = _normalize_domain(domain)
+        if key in self._gt_values_cache:
+            return self._gt_values_cache[key]
+        normalized = self._normalized_ground_truth(domain)
+        values = (
+            None if normalized is None
+            else {feat_name: entry["value"] for feat_name, entry in normalized.items()}
+        )
+        self._gt_values_cache[key] = values
+        return values
+
     def evaluate(self, extraction: ExtractedFeatures) -> EvaluationResult:
-        gt = self._find_ground_truth(extraction.domain)
-        if not gt:
+        normalized_gt = self._normalized_ground_truth(extraction.domain)
+        if normalized_gt is None:
             return EvaluationResult(
                 domain=extraction.domain,
                 crawler=extraction.crawler,
@@ -47,27 +143,24 @@ class GroundTruthComparator:
                 errors=[f"No ground truth found for {extraction.domain}"],
             )
 
-        gt_features = gt.get("features", {})
         scores: List[FeatureScore] = []
         presence_scores: List[PresenceScore] = []
         found = 0
         correct = 0
         present_correct = 0
 
-        for feat_name in FEATURES:
-            extracted_val = extraction.features.get(feat_name)
-            gt_feat, used_old_name = self._get_gt_feature(gt_features, feat_name)
-            gt_present = gt_feat.get("present", False) if gt_feat else False
-            gt_val = (
-                self._normalize_gt_value(feat_name, gt_feat, used_old_name)
-                if gt_present else None
-            )
+        # Pull every feature out of the extraction in one pass, aligned with FEATURES
+        extracted_vals = map(extraction.features.get, FEATURES)
+        for (feat_name, scorer), extracted_val in zip(self._feat_dispatch, extracted_vals):
+            gt_entry = normalized_gt[feat_name]
+            gt_present = gt_entry["present"]
+            gt_val = gt_entry["value"]
 
             extracted_present = self._is_present_value(extracted_val)
             if extracted_present:
                 found += 1
 
-            score, match_type = self._score_feature(feat_name, extracted_val, gt_val, gt_present)
+            score, match_type = self._score_with(scorer, extracted_val, gt_val, gt_present)
             if score >= 0.8:
                 correct += 1
 
@@ -79,9 +172,11 @@ class GroundTruthComparator:
                 match_type=match_type,
             ))
 
-            presence_score, presence_match = self._score_presence(extracted_present, gt_present)
-            if presence_score >= 1.0:
+            if extracted_present == gt_present:
+                presence_score, presence_match = _PRESENCE_MATCH
                 present_correct += 1
+            else:
+                presence_score, presence_match = _PRESENCE_MISMATCH
             presence_scores.append(PresenceScore(
                 feature_name=feat_name,
                 extracted_present=extracted_present,
@@ -90,8 +185,8 @@ class GroundTruthComparator:
                 match_type=presence_match,
             ))
 
-        accuracy = correct / len(FEATURES) if FEATURES else 0.0
-        presence_accuracy = present_correct / len(FEATURES) if FEATURES else 0.0
+        accuracy = correct / _N_FEATURES if _N_FEATURES else 0.0
+        presence_accuracy = present_correct / _N_FEATURES if _N_FEATURES else 0.0
 
         return EvaluationResult(
             domain=extraction.domain,
@@ -108,11 +203,21 @@ class GroundTruthComparator:
 
     # ── Scoring dispatch ─────────────────────────────────────────────────
 
-    def _score_feature(
-        self, feat_name: str, extracted: Any, ground_truth: Any, gt_present: bool
-    ) -> tuple:
-        feat_type = FEATURE_TYPES.get(feat_name, FeatureType.TEXT)
+    def _scorer_for(self, feat_name: str, feat_type: FeatureType) -> Callable[[Any, Any], tuple]:
+        """Type-specific scorer for a feature, called as scorer(extracted, ground_truth)."""
+        # Enum members are singletons: identity checks skip str.__eq__ on the str-mixin enum
+        if feat_type is FeatureType.LITERAL_BOOL:
+            return partial(self._score_literal_bool, feat_name=feat_name)
+        elif feat_type is FeatureType.LITERAL_ENUM:
+            return self._score_literal_enum
+        elif feat_type is FeatureType.LIST:
+            return self._score_list
+        else:
+            return self._score_text
 
+    def _score_with(
+        self, scorer: Callable[[Any, Any], tuple], extracted: Any, ground_truth: Any, gt_present: bool
+    ) -> tuple:
         # Both null — correct negative
         if extracted is None and not gt_present:
             return 1.0, "both_null"
@@ -131,27 +236,17 @@ class GroundTruthComparator:
             return 0.3, "false_positive"
 
         # Both have values — compare by type
-        if feat_type == FeatureType.LITERAL_BOOL:
-            return self._score_literal_bool(extracted, ground_truth, feat_name)
-        elif feat_type == FeatureType.LITERAL_ENUM:
-            return self._score_literal_enum(extracted, ground_truth)
-        elif feat_type == FeatureType.LIST:
-            return self._score_list(extracted, ground_truth)
-        else:
-            return self._score_text(extracted, ground_truth)
+        return scorer(extracted, ground_truth)
 
     # ── Type-specific scorers ────────────────────────────────────────────
 
     def _score_literal_bool(self, extracted: Any, ground_truth: Any, feat_name: str) -> tuple:
         """Score Literal['true', 'false', 'unknown'] fields."""
-        ext_str = str(extracted).lower().strip()
-        gt_str = str(ground_truth).lower().strip()
+        ext_str = _norm(str(extracted))
+        gt_str = _norm(str(ground_truth))
 
         # Normalize "yes"/"no" from GT
-        if gt_str in ("yes", "1"):
-            gt_str = "true"
-        elif gt_str in ("no", "0"):
-            gt_str = "false"
+        gt_str = _BOOL_NORM.get(gt_str, gt_str)
 
         if ext_str == gt_str:
             return 1.0, "exact"
@@ -162,8 +257,8 @@ class GroundTruthComparator:
 
     def _score_literal_enum(self, extracted: Any, ground_truth: Any) -> tuple:
         """Score Literal enum fields (e.g., product_category)."""
-        ext_str = str(extracted).lower().strip()
-        gt_str = str(ground_truth).lower().strip()
+        ext_str = _norm(str(extracted))
+        gt_str = _norm(str(ground_truth))
         if ext_str == gt_str:
             return 1.0, "exact"
         # Check if GT is contained in extracted or vice versa
@@ -184,8 +279,10 @@ class GroundTruthComparator:
         # Jaccard similarity on lowercased items
         ext_set = set(ext_items)
         gt_set = set(gt_items)
-        intersection = len(ext_set & gt_set)
-        union = len(ext_set | gt_set)
+        # Count the intersection from the smaller side; |A ∪ B| = |A| + |B| - |A ∩ B|
+        small, large = (ext_set, gt_set) if len(ext_set) <= len(gt_set) else (gt_set, ext_set)
+        intersection = sum(1 for item in small if item in large)
+        union = len(ext_set) + len(gt_set) - intersection
 
         if union == 0:
             return 1.0, "both_null"
@@ -196,32 +293,30 @@ class GroundTruthComparator:
         if jaccard >= 0.5:
             return 0.8, "close"
 
-        # Fallback: check word-level overlap across all items
-        ext_words = set()
-        for item in ext_items:
-            ext_words.update(re.findall(r'\w+', item))
-        gt_words = set()
-        for item in gt_items:
-            gt_words.update(re.findall(r'\w+', item))
-
-        if ext_words and gt_words:
-            word_overlap = len(ext_words & gt_words) / max(len(ext_words), len(gt_words))
-            if word_overlap > 0.5:
-                return 0.6, "partial"
+        # Fallback: check word-level overlap across all items. Only low-similarity
+        # pairs get here; tokenize each distinct item once, in a single regex pass
+        # (words never span the joining newline), and skip ext if GT has no words.
+        gt_words = set(_words("\n".join(gt_set)))
+        if gt_words:
+            ext_words = set(_words("\n".join(ext_set)))
+            if ext_words:
+                word_overlap = len(ext_words & gt_words) / max(len(ext_words), len(gt_words))
+                if word_overlap > 0.5:
+                    return 0.6, "partial"
 
         return 0.2, "mismatch"
 
     def _score_text(self, extracted: Any, ground_truth: Any) -> tuple:
         """Score plain text fields."""
-        ext_str = str(extracted).lower().strip()
-        gt_str = str(ground_truth).lower().strip()
+        ext_str = _norm(str(extracted))
+        gt_str = _norm(str(ground_truth))
         if ext_str == gt_str:
             return 1.0, "exact"
         if ext_str in gt_str or gt_str in ext_str:
             return 0.8, "substring"
         # Word overlap
-        ext_words = set(re.findall(r'\w+', ext_str))
-        gt_words = set(re.findall(r'\w+', gt_str))
+        ext_words = _word_set(ext_str)
+        gt_words = _word_set(gt_str)
         if ext_words and gt_words:
             overlap = len(ext_words & gt_words) / max(len(ext_words), len(gt_words))
             if overlap > 0.5:
@@ -240,20 +335,15 @@ class GroundTruthComparator:
             return low not in ("", "unknown", "null", "none")
         return True
 
-    def _score_presence(self, extracted_present: bool, gt_present: bool) -> tuple:
-        if extracted_present == gt_present:
-            return 1.0, "exact"
-        return 0.0, "mismatch"
-
-    def _normalize_list(self, val: Any) -> list:
+    def _normalize_list(self, val: Any) -> Sequence[str]:
         """Normalize a value into a list of lowercase strings for comparison."""
-        if isinstance(val, list):
+        # Values come from JSON, so exact type checks suffice
+        if type(val) is list:
             return [str(v).lower().strip() for v in val if v]
-        if isinstance(val, str):
-            # Ground truth may store lists as comma-separated strings
-            items = [s.strip().lower() for s in val.split(",")]
-            return [i for i in items if i]
-        return []
+        if type(val) is str:
+            # Ground truth may store lists as comma-separated strings (cached, read-only)
+            return _split_list_str(val)
+        return ()
 
     def _normalize_gt_value(self, feat_name: str, gt_feat: dict, used_old_name: bool) -> Any:
         """Extract the ground truth value in a form comparable to the new model's output."""
@@ -262,16 +352,19 @@ class GroundTruthComparator:
         val = gt_feat.get("value", "")
         feat_type = FEATURE_TYPES.get(feat_name, FeatureType.TEXT)
 
-        if feat_type == FeatureType.LITERAL_BOOL:
+        if feat_type is FeatureType.LITERAL_BOOL:
             # Convert GT boolean to string "true"/"false"
             low = str(val).lower().strip()
-            if low.startswith("yes") or low.startswith("true") or low == "1":
-                gt_bool = "true"
-            elif low.startswith("no") or low.startswith("false") or low == "0":
-                gt_bool = "false"
-            else:
-                # If present=true for a boolean feature, default to "true"
-                gt_bool = "true"
+            gt_bool = _BOOL_NORM.get(low)
+            if gt_bool is None:
+                # Longer values like "yes, on request" / "no (beta only)"
+                if low.startswith(("yes", "true")):
+                    gt_bool = "true"
+                elif low.startswith(("no", "false")):
+                    gt_bool = "false"
+                else:
+                    # If present=true for a boolean feature, default to "true"
+                    gt_bool = "true"
 
             # Handle inverted fields only when GT uses old names
             if used_old_name and feat_name in GT_INVERTED_BOOLEANS:
@@ -279,10 +372,10 @@ class GroundTruthComparator:
 
             return gt_bool
 
-        if feat_type == FeatureType.LITERAL_ENUM:
+        if feat_type is FeatureType.LITERAL_ENUM:
             return str(val).lower().strip()
 
-        if feat_type == FeatureType.LIST:
+        if feat_type is FeatureType.LIST:
             # GT may be a comma-separated string or already a list
             if isinstance(val, list):
                 return val
@@ -293,51 +386,82 @@ class GroundTruthComparator:
 
     def _get_gt_feature(self, gt_features: dict, new_feat_name: str) -> tuple[Optional[dict], bool]:
         """Look up feature from ground truth using old field names via GT_FIELD_MAP."""
-        # Reverse lookup: find old name(s) that map to this new name
-        old_names = [old for old, new in GT_FIELD_MAP.items() if new == new_feat_name]
-
-        for old_name in old_names:
-            # Try exact match
-            if old_name in gt_features:
-                return gt_features[old_name], True
-            # Try underscore/space variants
-            alt = old_name.replace("_", " ")
-            if alt in gt_features:
-                return gt_features[alt], True
-            alt2 = old_name.replace(" ", "_")
-            if alt2 in gt_features:
-                return gt_features[alt2], True
-
-        # Also try the new name directly (in case GT is already updated)
-        if new_feat_name in gt_features:
-            return gt_features[new_feat_name], False
+        # Old names with their underscore/space variants, then the new name itself
+        # (in case GT is already updated)
+        variants = self._gt_key_variants.get(new_feat_name)
+        if variants is None:
+            variants = ((new_feat_name, False),)
+        for key, used_old_name in variants:
+            if key in gt_features:
+                return gt_features[key], used_old_name
 
         return None, False
 
     def _find_ground_truth(self, domain: str) -> Optional[dict]:
-        norm = domain.replace("https://", "").replace("http://", "").replace("www.", "").rstrip("/")
-        return self._index.get(norm)
+        return self._index.get(_normalize_domain(domain))
 
     def _build_index(self) -> Dict[str, dict]:
         idx = {}
         for entry in self.ground_truth:
-            url = entry.get("url", "")
-            norm = url.replace("https://", "").replace("http://", "").replace("www.", "").rstrip("/")
-            idx[norm] = entry
+            idx[_normalize_domain(entry.get("url", ""))] = entry
         return idx
 
+    def _load_cached(self, path: Path) -> list:
+        """Load parsed GT from a pickle next to the JSONL, rebuilding it when stale."""
+        stat = path.stat()
+        key = f"{path}:{stat.st_mtime_ns}:{stat.st_size}"
+        cache_path = path.with_name(path.name + ".cache.pkl")
+        try:
+            with open(cache_path, "rb") as f:
+                if pickle.load(f) == key:
+                    return pickle.load(f)
+        except Exception:
+            pass  # missing, stale or unreadable cache — rebuild below
+
+        entries = self._load_jsonl(path)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump(key, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # read-only location: just skip caching
+        return entries
+
     def _load_jsonl(self, path: Path) -> list:
+        entries: list = []
+        buf: List[str] = []
         with open(path, "r") as f:
-            content = f.read()
-        # Handle multi-line JSON entries
-        entries_raw = re.split(r'(?=\{"company")', content)
-        entries = []
-        for raw in entries_raw:
-            raw = raw.strip()
-            if not raw:
+            for line in f:
+                # Records may span lines; a new one starts at {"company"
+                if buf and line.lstrip().startswith('{"company"'):
+                    self._parse_jsonl_record("".join(buf), entries)
+                    buf.clear()
+                buf.append(line)
+        if buf:
+            self._parse_jsonl_record("".join(buf), entries)
+        return entries
+
+    @staticmethod
+    def _parse_jsonl_record(raw: str, entries: list) -> None:
+        raw = raw.strip()
+        if not raw:
+            return
+        try:
+            entries.append(jsonio.loads(raw))
+            return
+        except jsonio.JSONDecodeError:
+            pass
+        # Several records glued onto one line: split at each record start
+        parts = _JSON_SPLIT_RE.split(raw)
+        if len(parts) < 2:
+            return
+        for part in parts:
+            part = part.strip()
+            if not part:
                 continue
             try:
-                entries.append(json.loads(raw))
-            except json.JSONDecodeError:
+                entries.append(jsonio.loads(part))
+            except jsonio.JSONDecodeError:
                 continue
-        return entries
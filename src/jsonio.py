@@ -0,0 +1,37 @@
+"""
+JSON (de)serialization helpers — orjson when installed, stdlib json otherwise.
+"""
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+    import json
+
+
+if orjson is not None:
+    JSONDecodeError = orjson.JSONDecodeError
+
+    def loads(data):
+        """Parse JSON from bytes or str."""
+        return orjson.loads(data)
+
+    def dumps(obj, indent: bool = False) -> bytes:
+        """Serialize to UTF-8 JSON bytes; unknown types fall back to str()."""
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_DATACLASS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=str, option=option)
+
+else:
+    JSONDecodeError = json.JSONDecodeError
+
+    def loads(data):
+        """Parse JSON from bytes or str."""
+        return json.loads(data)
+
+    def dumps(obj, indent: bool = False) -> bytes:
+        """Serialize to UTF-8 JSON bytes; unknown types fall back to str()."""
+        return json.dumps(
+            obj, indent=2 if indent else None, default=str, ensure_ascii=False
+        ).encode("utf-8")
@@ -1,37 +1,50 @@
-import json
+import asyncio
 import re
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Optional, Dict, Any
 
+from src import jsonio
 from src.types import ParsedContent, ExtractedFeatures, LLMType
-from src.models import AugmentedCompany, FEATURES, SKIP_FIELDS
+from src.models import FEATURES, SKIP_FIELDS
+from src.llm.prompt import EXTRACTION_PROMPT_WITH_SEP
+
+
+_CODEBLOCK_RE = re.compile(r"```(?:json)?\s*\n?(.*?)\n?```", re.DOTALL)
+_BRACE_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+SYSTEM_MSG = (
+    "You are an expert data extraction AI. "
+    "Extract structured company information from website content. "
+    "Return ONLY valid JSON matching the AugmentedCompany schema."
+)
 
 
 class BaseLLMExtractor(ABC):
     llm_type: LLMType
 
-    def __init__(self, api_key: str, model: str):
+    def __init__(self, api_key: str, model: str, concurrency: int = 16):
         self.api_key = api_key
         self.model = model
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
 
     @abstractmethod
     async def _call_llm(self, system_msg: str, user_msg: str) -> str:
         """Make the actual API call, return raw text response."""
         ...
 
-    async def extract(self, parsed_content: ParsedContent) -> ExtractedFeatures:
-        from datetime import datetime
-        from src.llm.prompt import EXTRACTION_PROMPT
+    async def close(self):
+        """Close the API client's connection pool."""
+        client = getattr(self, "client", None)
+        if client is not None:
+            await client.close()
 
-        system_msg = (
-            "You are an expert data extraction AI. "
-            "Extract structured company information from website content. "
-            "Return ONLY valid JSON matching the AugmentedCompany schema."
-        )
-        user_msg = EXTRACTION_PROMPT + "\n\n" + parsed_content.markdown
+    async def extract(self, parsed_content: ParsedContent) -> ExtractedFeatures:
+        user_msg = EXTRACTION_PROMPT_WITH_SEP + parsed_content.markdown
 
         try:
-            raw_response = await self._call_llm(system_msg, user_msg)
+            async with self._semaphore:
+                raw_response = await self._call_llm(SYSTEM_MSG, user_msg)
             features = self._parse_and_validate(raw_response, parsed_content.domain)
             return ExtractedFeatures(
                 domain=parsed_content.domain,
@@ -53,38 +66,29 @@ class BaseLLMExtractor(ABC):
             )
 
     def _parse_and_validate(self, text: str, domain: str) -> Dict[str, Any]:
-        """Parse LLM response, validate with Pydantic, return evaluable features only."""
+        """Parse LLM response and return evaluable features only."""
         raw_dict = self._parse_json(text)
 
         # Ensure domain is set
         raw_dict.setdefault("domain", domain)
 
-        # Try Pydantic validation (strict schema conformance)
-        try:
-            validated = AugmentedCompany.model_validate(raw_dict)
-            full_dict = validated.model_dump()
-        except Exception:
-            # Fall back to raw dict if validation fails
-            full_dict = raw_dict
-
-        # Extract only evaluable features (skip domain + explanations)
-        features = {}
-        for feat_name in FEATURES:
-            features[feat_name] = full_dict.get(feat_name)
-        return features
+        # AugmentedCompany has no defaults or coercions that apply to JSON input, so a
+        # validate + dump round-trip would hand back these same values (and invalid
+        # responses already fell back to the raw dict). Project the features directly.
+        return {feat_name: raw_dict.get(feat_name) for feat_name in FEATURES}
 
     def _parse_json(self, text: str) -> dict:
         # Try direct parse
         try:
-            return json.loads(text)
-        except json.JSONDecodeError:
+            return jsonio.loads(text)
+        except jsonio.JSONDecodeError:
             pass
         # Try extracting from ```json ... ``` blocks
-        m = re.search(r"```(?:json)?\s*\n?(.*?)\n?```", text, re.DOTALL)
+        m = _CODEBLOCK_RE.search(text) if "```" in text else None
         if m:
-            return json.loads(m.group(1))
+            return jsonio.loads(m.group(1))
         # Try finding first { ... } block
-        m = re.search(r"\{.*\}", text, re.DOTALL)
+        m = _BRACE_RE.search(text)
         if m:
-            return json.loads(m.group(0))
+            return jsonio.loads(m.group(0))
         raise ValueError(f"Could not parse JSON from LLM response: {text[:200]}")
@@ -1,34 +1,35 @@
-import json
 import anthropic
+from src import jsonio
 from src.llm.base import BaseLLMExtractor
 from src.types import LLMType
 from src.models import AugmentedCompany
 
 
+# Build the tool schema from AugmentedCompany's JSON schema once, not per request
+_TOOL_SCHEMA = AugmentedCompany.model_json_schema()
+# Remove the 'title' key (not needed for Claude tool_use)
+_TOOL_SCHEMA.pop("title", None)
+_TOOLS = [{
+    "name": "extract_company_data",
+    "description": "Extract structured company data from website content.",
+    "input_schema": _TOOL_SCHEMA,
+}]
+
+
 class ClaudeExtractor(BaseLLMExtractor):
     llm_type = LLMType.CLAUDE
 
-    def __init__(self, api_key: str, model: str = "claude-sonnet-4-20250514"):
-        super().__init__(api_key, model)
+    def __init__(self, api_key: str, model: str = "claude-sonnet-4-20250514", concurrency: int = 16):
+        super().__init__(api_key, model, concurrency)
         self.client = anthropic.AsyncAnthropic(api_key=api_key)
 
     async def _call_llm(self, system_msg: str, user_msg: str) -> str:
-        # Build the tool schema from AugmentedCompany's JSON schema
-        tool_schema = AugmentedCompany.model_json_schema()
-
-        # Remove the 'title' key (not needed for Claude tool_use)
-        tool_schema.pop("title", None)
-
         response = await self.client.messages.create(
             model=self.model,
             max_tokens=8000,
             temperature=0,  # Deterministic extraction (no creativity)
             system=system_msg,
-            tools=[{
-                "name": "extract_company_data",
-                "description": "Extract structured company data from website content.",
-                "input_schema": tool_schema,
-            }],
+            tools=_TOOLS,
             tool_choice={"type": "tool", "name": "extract_company_data"},
             messages=[{"role": "user", "content": user_msg}],
         )
@@ -36,7 +37,7 @@ class ClaudeExtractor(BaseLLMExtractor):
         # Extract the tool_use result
         for block in response.content:
             if block.type == "tool_use":
-                return json.dumps(block.input)
+                return jsonio.dumps(block.input).decode()
 
         # Fallback: try text content
         for block in response.content:
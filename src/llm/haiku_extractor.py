@@ -1,38 +1,40 @@
-import json
 import anthropic
+from src import jsonio
 from src.llm.base import BaseLLMExtractor
 from src.types import LLMType
 from src.models import AugmentedCompany
 
 
+_TOOL_SCHEMA = AugmentedCompany.model_json_schema()
+_TOOL_SCHEMA.pop("title", None)
+_TOOLS = [{
+    "name": "extract_company_data",
+    "description": "Extract structured company data from website content.",
+    "input_schema": _TOOL_SCHEMA,
+}]
+
+
 class HaikuExtractor(BaseLLMExtractor):
     llm_type = LLMType.HAIKU
 
-    def __init__(self, api_key: str, model: str = "claude-haiku-4-5-20251001"):
-        super().__init__(api_key, model)
+    def __init__(self, api_key: str, model: str = "claude-haiku-4-5-20251001", concurrency: int = 16):
+        super().__init__(api_key, model, concurrency)
         self.client = anthropic.AsyncAnthropic(api_key=api_key)
 
     async def _call_llm(self, system_msg: str, user_msg: str) -> str:
-        tool_schema = AugmentedCompany.model_json_schema()
-        tool_schema.pop("title", None)
-
         response = await self.client.messages.create(
             model=self.model,
             max_tokens=8000,
             temperature=0,
             system=system_msg,
-            tools=[{
-                "name": "extract_company_data",
-                "description": "Extract structured company data from website content.",
-                "input_schema": tool_schema,
-            }],
+            tools=_TOOLS,
             tool_choice={"type": "tool", "name": "extract_company_data"},
             messages=[{"role": "user", "content": user_msg}],
         )
 
         for block in response.content:
             if block.type == "tool_use":
-                return json.dumps(block.input)
+                return jsonio.dumps(block.input).decode()
 
         for block in response.content:
             if block.type == "text":
@@ -7,8 +7,8 @@ from src.models import AugmentedCompany
 class OpenAIExtractor(BaseLLMExtractor):
     llm_type = LLMType.OPENAI
 
-    def __init__(self, api_key: str, model: str = "gpt-4o"):
-        super().__init__(api_key, model)
+    def __init__(self, api_key: str, model: str = "gpt-4o", concurrency: int = 16):
+        super().__init__(api_key, model, concurrency)
         self.client = AsyncOpenAI(api_key=api_key)
 
     async def _call_llm(self, system_msg: str, user_msg: str) -> str:
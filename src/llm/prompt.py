@@ -69,3 +69,5 @@ def _format_type(annotation) -> str:
 
 # Pre-built prompt (used at import time)
 EXTRACTION_PROMPT = build_extraction_prompt()
+# Prompt plus the blank line separating it from the page content
+EXTRACTION_PROMPT_WITH_SEP = EXTRACTION_PROMPT + "\n\n"
@@ -1,9 +1,12 @@
-import json
+import asyncio
+import hashlib
 from typing import List, Dict, Any
 
 from openai import AsyncOpenAI
 from pydantic import BaseModel, Field
 
+from src import jsonio
+
 
 class FeatureSimilarity(BaseModel):
     feature: str = Field(description="Feature name")
@@ -23,6 +26,14 @@ class LLMValueComparator:
     ):
         self.openai = AsyncOpenAI(api_key=openai_api_key) if openai_api_key else None
         self.openai_model = openai_model
+        # Prompt digest -> in-flight or finished comparison. Combos of one domain share
+        # the ground truth and often extract identical values, so repeats reuse one call
+        self._openai_memo: Dict[bytes, asyncio.Future] = {}
+
+    async def close(self):
+        """Close the OpenAI client's connection pool."""
+        if self.openai is not None:
+            await self.openai.close()
 
     def _build_prompt(self, extracted: Dict[str, Any], ground_truth: Dict[str, Any]) -> str:
         return (
@@ -31,15 +42,30 @@ class LLMValueComparator:
             "Use partial credit for overlapping items and fuzzy matches. "
             "If both are empty/unknown, similarity should be 1.0. "
             "If ground truth is present but extracted is empty/unknown, similarity should be 0.0.\n\n"
-            f"EXTRACTED:\n{json.dumps(extracted, ensure_ascii=True)}\n\n"
-            f"GROUND_TRUTH:\n{json.dumps(ground_truth, ensure_ascii=True)}\n"
+            f"EXTRACTED:\n{jsonio.dumps(extracted).decode()}\n\n"
+            f"GROUND_TRUTH:\n{jsonio.dumps(ground_truth).decode()}\n"
         )
 
     async def compare_openai(self, extracted: Dict[str, Any], ground_truth: Dict[str, Any]) -> List[Dict[str, Any]]:
         if not self.openai:
             return []
-        system_msg = "You are a precise evaluator. Return only valid JSON that matches the schema."
         user_msg = self._build_prompt(extracted, ground_truth)
+        key = hashlib.blake2b(user_msg.encode(), digest_size=16).digest()
+        pending = self._openai_memo.get(key)
+        if pending is None:
+            pending = self._openai_memo[key] = asyncio.ensure_future(self._request_openai(user_msg))
+            pending.add_done_callback(lambda fut: self._forget_failed(key, fut))
+        # shield: one caller being cancelled must not cancel the call others await
+        results = await asyncio.shield(pending)
+        return list(results)
+
+    def _forget_failed(self, key: bytes, fut: asyncio.Future):
+        """Drop a failed comparison so a later identical one retries the call."""
+        if fut.cancelled() or fut.exception() is not None:
+            self._openai_memo.pop(key, None)
+
+    async def _request_openai(self, user_msg: str) -> List[Dict[str, Any]]:
+        system_msg = "You are a precise evaluator. Return only valid JSON that matches the schema."
         response = await self.openai.beta.chat.completions.parse(
             model=self.openai_model,
             messages=[
@@ -3,6 +3,7 @@ AugmentedCompany Pydantic model — the single source of truth for feature extra
 All feature names, types, descriptions, and evaluation categories are derived from this model.
 """
 
+from functools import lru_cache
 from typing import Literal, get_args, get_origin
 from enum import Enum
 from pydantic import BaseModel, Field
@@ -132,18 +133,6 @@ class FeatureType(str, Enum):
     LIST = "list"                      # list[str]
 
 
-# Fields to skip during evaluation (metadata + chain-of-thought explanations)
-SKIP_FIELDS = {"domain"} | {
-    name for name in AugmentedCompany.model_fields
-    if name.endswith("_explanation")
-}
-
-# The evaluable feature names (everything except domain and explanations)
-FEATURES = [
-    name for name in AugmentedCompany.model_fields
-    if name not in SKIP_FIELDS
-]
-
 # Literal boolean values (the allowed string sets for bool-like fields)
 _BOOL_LITERALS = {
     frozenset({"true", "false"}),
@@ -151,10 +140,9 @@ _BOOL_LITERALS = {
 }
 
 
-def _classify_field(field_name: str) -> FeatureType:
-    """Determine the evaluation type of a model field."""
-    annotation = AugmentedCompany.model_fields[field_name].annotation
-
+@lru_cache(maxsize=None)
+def _classify_annotation(annotation) -> FeatureType:
+    """Determine the evaluation type of a field annotation."""
     # Check for list[str]
     origin = get_origin(annotation)
     if origin is list:
@@ -172,7 +160,32 @@ def _classify_field(field_name: str) -> FeatureType:
     return FeatureType.TEXT
 
 
-FEATURE_TYPES = {name: _classify_field(name) for name in FEATURES}
+def _classify_field(field_name: str) -> FeatureType:
+    """Determine the evaluation type of a model field."""
+    return _classify_annotation(AugmentedCompany.model_fields[field_name].annotation)
+
+
+# One pass over the model fields builds:
+#   SKIP_FIELDS   — fields to skip during evaluation (metadata + chain-of-thought explanations)
+#   FEATURES      — the evaluable feature names (everything except domain and explanations)
+#   FEATURE_TYPES — evaluation type of each feature
+_skip = {"domain"}
+_features = []
+FEATURE_TYPES = {}
+for _name, _field_info in AugmentedCompany.model_fields.items():
+    if _name in _skip or _name.endswith("_explanation"):
+        _skip.add(_name)
+        continue
+    _features.append(_name)
+    FEATURE_TYPES[_name] = _classify_annotation(_field_info.annotation)
+
+SKIP_FIELDS = frozenset(_skip)
+FEATURES = tuple(_features)
+# FEATURE_TYPES in FEATURES order, for index-aligned iteration without dict lookups
+FEATURE_TYPES_TUPLE = tuple(FEATURE_TYPES[name] for name in FEATURES)
+# Feature name -> position in FEATURES, for filling per-feature columns by index
+FEATURE_INDEX = {name: i for i, name in enumerate(FEATURES)}
+del _skip, _features, _name, _field_info
 
 
 # ── Ground Truth Field Mapping (old JSONL names → new model names) ───────────
@@ -202,4 +215,4 @@ GT_FIELD_MAP = {
 }
 
 # Fields where ground truth semantics are inverted relative to new model
-GT_INVERTED_BOOLEANS = {"under_maintenance", "early_access"}
+GT_INVERTED_BOOLEANS = frozenset({"under_maintenance", "early_access"})
@@ -4,6 +4,29 @@ from src.types import CrawlResult, ParsedContent
 
 MAX_CHARS_PER_PAGE = 25000
 MAX_TOTAL_CHARS = 200000
+# Raw pages longer than this are cleaned head-first (see MarkdownParser._clean_page)
+PRECLEAN_CHARS = MAX_CHARS_PER_PAGE * 4
+# Cleaned head must exceed the page cap by this much, covering the few chars at its
+# end that may clean differently from the full page (e.g. a linked image's "[")
+_PRECLEAN_MARGIN = 1000
+_SECTION_SEP = "\n\n---\n\n"
+
+_LINKED_IMAGE_RE = re.compile(r"\[\s*!\[[^\]]*\]\([^)]+\)\s*\]\([^)]+\)")
+_IMAGE_RE = re.compile(r"!\[[^\]]*\]\([^)]+\)")
+_DECORATIVE_IMAGE_RE = re.compile(r"!\[(?:icon|logo|arrow|decoration).*?\]\(.*?\)", re.IGNORECASE)
+_BASE64_RE = re.compile(r"data:image/[^;]+;base64,[A-Za-z0-9+/=]{100,}")
+_COOKIE_RE = re.compile(r"(?i)(?:we use cookies|cookie policy|accept all|reject all|manage preferences)[^\n]*\n")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+
+def _images_closed(text: str) -> bool:
+    """True when no image markdown in text is left open at its end: the last "!["
+    starts a complete image and no "](" target follows the last ")". Conservative:
+    some closed texts report False, which only costs a full-page clean."""
+    last = text.rfind("![")
+    if last != -1 and not _IMAGE_RE.match(text, last):
+        return False
+    return text.rfind("](") < text.rfind(")")
 
 
 class MarkdownParser:
@@ -12,16 +35,21 @@ class MarkdownParser:
     def parse(self, crawl_result: CrawlResult) -> ParsedContent:
         cleaned_pages = {}
         for page_name, raw in crawl_result.page_contents.items():
-            cleaned = self._clean_markdown(raw)
-            if len(cleaned) > MAX_CHARS_PER_PAGE:
-                cleaned = cleaned[:MAX_CHARS_PER_PAGE] + "\n\n[...truncated]"
-            cleaned_pages[page_name] = cleaned
-
-        combined = "\n\n---\n\n".join(
-            f"# PAGE: {name.upper()}\n\n{text}"
-            for name, text in cleaned_pages.items()
-            if text.strip()
-        )
+            cleaned_pages[page_name] = self._clean_page(raw)
+
+        # Join sections only until the budget is exceeded; later pages would be cut anyway.
+        # Cleaned pages are already stripped, so non-empty means non-blank.
+        sections = []
+        total = -len(_SECTION_SEP)
+        for name, text in cleaned_pages.items():
+            if not text:
+                continue
+            section = f"# PAGE: {name.upper()}\n\n{text}"
+            sections.append(section)
+            total += len(_SECTION_SEP) + len(section)
+            if total > MAX_TOTAL_CHARS:
+                break
+        combined = _SECTION_SEP.join(sections)
 
         if len(combined) > MAX_TOTAL_CHARS:
             combined = combined[:MAX_TOTAL_CHARS] + "\n\n[...truncated]"
@@ -34,27 +62,44 @@ class MarkdownParser:
             char_count=len(combined),
         )
 
+    def _clean_page(self, raw: str) -> str:
+        """Clean one page and cap it at MAX_CHARS_PER_PAGE."""
+        if raw and len(raw) > PRECLEAN_CHARS:
+            # Cleaning only shrinks text, so most of an oversized page is cut anyway.
+            # Clean a head ending in a newline: no two-char token ("![", "](") or
+            # single-line pass (base64, cookie lines) crosses that cut, and images
+            # that would (multi-line alt text or targets) are ruled out by
+            # _images_closed. Fall back to the whole page when the head has an open
+            # image or cleaning removed so much of it that it runs short.
+            cut = raw.rfind("\n", 0, PRECLEAN_CHARS)
+            if cut > 0 and _images_closed(raw[:cut]):
+                head = self._clean_markdown(raw[:cut + 1])
+                if len(head) > MAX_CHARS_PER_PAGE + _PRECLEAN_MARGIN:
+                    return head[:MAX_CHARS_PER_PAGE] + "\n\n[...truncated]"
+        cleaned = self._clean_markdown(raw)
+        if len(cleaned) > MAX_CHARS_PER_PAGE:
+            cleaned = cleaned[:MAX_CHARS_PER_PAGE] + "\n\n[...truncated]"
+        return cleaned
+
     def _clean_markdown(self, text: str) -> str:
         if not text:
             return ""
-        # Remove excessive blank lines
-        text = re.sub(r"\n{4,}", "\n\n\n", text)
-        # Drop linked images and inline images
-        text = re.sub(r"\[\s*!\[[^\]]*\]\([^)]+\)\s*\]\([^)]+\)", "", text)
-        text = re.sub(r"!\[[^\]]*\]\([^)]+\)", "", text)
-        # Remove image markdown that's just decorative
-        text = re.sub(r"!\[(?:icon|logo|arrow|decoration).*?\]\(.*?\)", "", text, flags=re.IGNORECASE)
+        # Substring checks are far cheaper than a regex scan, so passes whose
+        # required literal is absent are skipped outright
+        if "![" in text:
+            # Drop linked images and inline images
+            text = _LINKED_IMAGE_RE.sub("", text)
+            text = _IMAGE_RE.sub("", text)
+            # Remove image markdown that's just decorative
+            text = _DECORATIVE_IMAGE_RE.sub("", text)
         # Remove very long base64 data URIs
-        text = re.sub(r"data:image/[^;]+;base64,[A-Za-z0-9+/=]{100,}", "[base64-image]", text)
+        if ";base64," in text:
+            text = _BASE64_RE.sub("[base64-image]", text)
         # Remove cookie/consent banner boilerplate
-        text = re.sub(
-            r"(?i)(we use cookies|cookie policy|accept all|reject all|manage preferences).*?\n",
-            "",
-            text,
-        )
+        text = _COOKIE_RE.sub("", text)
         # Strip leading/trailing whitespace per line
         lines = [line.strip() for line in text.split("\n")]
         text = "\n".join(lines)
-        # Collapse multiple blank lines again
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        # Collapse multiple blank lines (any run of 3+ newlines ends up as exactly 2)
+        text = _BLANK_LINES_RE.sub("\n\n", text)
         return text.strip()
@@ -1,18 +1,44 @@
 import csv
+from functools import lru_cache
 from pathlib import Path
 from typing import List
 
 
 def load_domains_csv(path: Path) -> List[str]:
     """Load domains from CSV. Expects a 'domain' column (or first column)."""
-    domains = []
-    with open(path, "r") as f:
-        reader = csv.DictReader(f)
+    raw = []
+    # newline="" lets the csv module handle quoted newlines and \r\n itself
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return []
+        # Resolve column positions once instead of building a dict per row
+        # (a repeated header name refers to its last column, as with DictReader)
+        positions = {name: i for i, name in enumerate(header)}
+        columns = [positions[name] for name in ("domain", "url") if name in positions]
+        first = positions[header[0]]
         for row in reader:
-            domain = row.get("domain") or row.get("url") or list(row.values())[0]
-            domain = domain.strip()
-            if domain:
-                if not domain.startswith("http"):
-                    domain = f"https://{domain}"
-                domains.append(domain)
-    return domains
+            if not row:
+                continue
+            domain = ""
+            for i in columns:
+                if i < len(row) and row[i]:
+                    domain = row[i]
+                    break
+            else:
+                if first < len(row):
+                    domain = row[first]
+            raw.append(domain)
+    # Clean up and add the scheme in one bulk pass over the picked cells
+    urls = [_domain_to_url(domain) for domain in raw]
+    return [url for url in urls if url]
+
+
+@lru_cache(maxsize=100_000)
+def _domain_to_url(domain: str) -> str:
+    """Stripped cell -> URL with a scheme ("" for blank cells); repeats across CSVs hit the cache."""
+    domain = domain.strip()
+    if domain and not domain.startswith("http"):
+        domain = f"https://{domain}"
+    return domain
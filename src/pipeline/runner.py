@@ -1,17 +1,22 @@
 import asyncio
-import json
 import logging
+import os
+import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, NamedTuple, Optional
 
+from src import jsonio
 from src.config import Config
 from src.types import (
-    CrawlerType, LLMType, BenchmarkReport,
+    CrawlerType, LLMType, BenchmarkReport, FEATURES, FEATURE_INDEX,
     EvaluationResult, CrawlResult, ParsedContent, ExtractedFeatures,
 )
+from src.crawlers.base import BaseCrawler
 from src.crawlers.registry import get_crawler
 from src.parser.markdown_parser import MarkdownParser
+from src.llm.base import BaseLLMExtractor
 from src.llm.registry import get_extractor
 from src.llm.value_compare import LLMValueComparator
 from src.evaluator.comparator import GroundTruthComparator
@@ -19,12 +24,134 @@ from src.pipeline.summary import compute_summary
 
 logger = logging.getLogger(__name__)
 
+_SLUG_RE = re.compile(r"[^a-zA-Z0-9._-]+")
+
+
+@lru_cache(maxsize=1024)
+def _domain_key(domain: str) -> str:
+    """Directory name for a domain's intermediate artifacts."""
+    return _SLUG_RE.sub("_", domain.replace("https://", "").replace("http://", "")).strip("_")
+
+
+def _intermediate_path(output_dir: Path, domain: str, crawler: str, *filename: str) -> Path:
+    """output_dir/intermediate/<domain key>/<crawler>[/<filename>], built in one join."""
+    return output_dir.joinpath("intermediate", _domain_key(domain), crawler, *filename)
+
+
+# CSV text of an unscored feature cell (csv.writer writes 0.0 as "0.0")
+_ZERO_SCORE_TEXT = str(0.0)
+
+
+class _ArtifactStats(NamedTuple):
+    """Crawl/parse numbers of a cached artifact, without its page text."""
+    page_count: int
+    char_count: int
+    duration_seconds: float
+    homepage_internal_links: int
+    homepage_internal_links_crawled: int
+    homepage_external_links: int
+    homepage_total_links: int
+
+
+class _RoundMemo(dict):
+    """score -> round(score, ndigits), computed once per distinct score.
+
+    Scores come from a handful of fixed values and ratios, so a report with
+    thousands of rows rounds only a few dozen distinct floats.
+    """
+
+    __slots__ = ("ndigits",)
+
+    def __init__(self, ndigits: int):
+        super().__init__()
+        self.ndigits = ndigits
+
+    def __missing__(self, score: float) -> float:
+        rounded = self[score] = round(score, self.ndigits)
+        return rounded
+
+
+class _RoundTextMemo(_RoundMemo):
+    """score -> str(round(score, ndigits)), the exact cell text csv.writer would
+    produce for the rounded float, so each distinct score is formatted once."""
+
+    __slots__ = ()
+
+    def __missing__(self, score: float) -> str:
+        text = self[score] = str(round(score, self.ndigits))
+        return text
+
+
+def _failed_result(
+    domain: str, crawler: CrawlerType, llm: LLMType, error: str
+) -> EvaluationResult:
+    """Zero-score result recording why a crawler/LLM combo produced no evaluation."""
+    return EvaluationResult(
+        domain=domain,
+        crawler=crawler,
+        llm=llm,
+        overall_accuracy=0.0,
+        features_found=0,
+        features_correct=0,
+        overall_presence_accuracy=0.0,
+        features_present_correct=0,
+        errors=[error],
+    )
+
 
 class BenchmarkRunner:
     def __init__(self, config: Config):
         self.config = config
         self.parser = MarkdownParser()
         self.comparator = GroundTruthComparator(config.ground_truth_path)
+        # One instance per crawler/LLM type for the whole run, so HTTP sessions and
+        # API client connection pools are reused across domains
+        self._crawlers: Dict[CrawlerType, BaseCrawler] = {}
+        self._extractors: Dict[LLMType, BaseLLMExtractor] = {}
+        self._value_comparator: Optional[LLMValueComparator] = None
+        # (domain_key, crawler) -> stem of the artifact _load_any_cached_artifact picks
+        # (None when there is none), so each intermediate/ directory is scanned once
+        self._any_cache: Dict[tuple[str, str], Optional[str]] = {}
+
+    def _get_crawler(self, crawler_type: CrawlerType) -> BaseCrawler:
+        crawler = self._crawlers.get(crawler_type)
+        if crawler is None:
+            crawler = self._crawlers[crawler_type] = get_crawler(crawler_type, self.config)
+        return crawler
+
+    def _get_extractor(self, llm_type: LLMType) -> BaseLLMExtractor:
+        extractor = self._extractors.get(llm_type)
+        if extractor is None:
+            extractor = self._extractors[llm_type] = get_extractor(llm_type, self.config)
+        return extractor
+
+    def _get_value_comparator(self) -> LLMValueComparator:
+        if self._value_comparator is None:
+            self._value_comparator = LLMValueComparator(
+                openai_api_key=self.config.openai_api_key,
+            )
+        return self._value_comparator
+
+    async def close(self):
+        """Close crawler sessions/browsers and LLM clients opened during the run."""
+        crawlers, self._crawlers = list(self._crawlers.values()), {}
+        for crawler in crawlers:
+            try:
+                await crawler.close()
+            except Exception as e:
+                logger.warning(f"  {crawler.crawler_type.value} close error: {e}")
+        extractors, self._extractors = list(self._extractors.values()), {}
+        for extractor in extractors:
+            try:
+                await extractor.close()
+            except Exception as e:
+                logger.warning(f"  {extractor.llm_type.value} close error: {e}")
+        value_comparator, self._value_comparator = self._value_comparator, None
+        if value_comparator is not None:
+            try:
+                await value_comparator.close()
+            except Exception as e:
+                logger.warning(f"  value comparator close error: {e}")
 
     async def run(
         self,
@@ -40,224 +167,46 @@ class BenchmarkRunner:
         all_results: List[EvaluationResult] = []
         total = len(domains) * len(crawlers) * len(llms)
         done = 0
-        llm_value_comparator = None
-        if llm_compare:
-            llm_value_comparator = LLMValueComparator(
-                openai_api_key=self.config.openai_api_key,
-            )
-
-        for domain in domains:
-            logger.info(f"{'='*60}")
-            logger.info(f"Domain: {domain}")
-
-            # If LLM compare is enabled, require cached crawl+extraction artifacts
-            if llm_compare:
-                async def _process_cached_combo(ct: CrawlerType, llm_type: LLMType):
-                    try:
-                        cached = self._load_cached_artifact(
-                            domain, ct.value, llm_type.value, self.config.output_dir
-                        )
-                        if cached is None:
-                            raise ValueError(
-                                f"Missing cached intermediate for {domain} "
-                                f"{ct.value}/{llm_type.value}"
-                            )
-                        crawl_result, parsed, extraction = cached
-
-                        eval_result = self.comparator.evaluate(extraction)
-                        eval_result.homepage_internal_links = crawl_result.homepage_internal_links
-                        eval_result.homepage_internal_links_crawled = crawl_result.homepage_internal_links_crawled
-                        eval_result.homepage_total_links = crawl_result.homepage_total_links
-                        eval_result.homepage_external_links = crawl_result.homepage_external_links
-
-                        gt_map = self.comparator.get_normalized_ground_truth(extraction.domain)
-                        if gt_map:
-                            extracted_vals = extraction.features
-                            gt_vals = {k: v["value"] for k, v in gt_map.items()}
-                            openai_scores = self._load_llm_comparison(
-                                extraction.domain,
-                                ct.value,
-                                llm_type.value,
-                                self.config.output_dir,
-                            )
-                            if openai_scores is None:
-                                openai_scores = await llm_value_comparator.compare_openai(
-                                    extracted_vals, gt_vals
+        llm_value_comparator = self._get_value_comparator() if llm_compare else None
+        # Caps cached combos in flight so OpenAI comparisons and artifact reads
+        # don't all start at once
+        combo_slots = asyncio.Semaphore(max(1, self.config.combo_concurrency))
+
+        try:
+            for domain in domains:
+                logger.info("=" * 60)
+                logger.info("Domain: %s", domain)
+
+                # If LLM compare is enabled, require cached crawl+extraction artifacts
+                if llm_compare:
+                    async def _process_cached_combo(ct: CrawlerType, llm_type: LLMType):
+                        async with combo_slots:
+                            try:
+                                # Only the extraction and crawl/parse stats are used here, so skip
+                                # holding page text while the OpenAI comparison is awaited
+                                cached = await self._load_extraction_only(
+                                    domain, ct.value, llm_type.value, self.config.output_dir
                                 )
-                                if save_intermediate:
-                                    self._save_llm_comparison(
-                                        extraction.domain,
-                                        ct.value,
-                                        llm_type.value,
-                                        openai_scores,
-                                        self.config.output_dir,
+                                if cached is None:
+                                    raise ValueError(
+                                        f"Missing cached intermediate for {domain} "
+                                        f"{ct.value}/{llm_type.value}"
                                     )
-                            self._apply_llm_compare_scores(eval_result, openai_scores)
-
-                        return {
-                            "ok": True,
-                            "crawler": ct,
-                            "llm": llm_type,
-                            "eval_result": eval_result,
-                            "page_count": len(crawl_result.page_contents),
-                            "char_count": parsed.char_count,
-                            "duration_seconds": crawl_result.duration_seconds,
-                        }
-                    except Exception as e:
-                        return {
-                            "ok": False,
-                            "crawler": ct,
-                            "llm": llm_type,
-                            "error": str(e),
-                        }
-
-                tasks = [
-                    asyncio.create_task(_process_cached_combo(ct, llm_type))
-                    for ct in crawlers
-                    for llm_type in llms
-                ]
-
-                for completed in asyncio.as_completed(tasks):
-                    result = await completed
-                    if result["ok"]:
-                        eval_result = result["eval_result"]
-                        all_results.append(eval_result)
-                        logger.info(
-                            f"  {result['crawler'].value} (cached): "
-                            f"{result['page_count']} pages, "
-                            f"{result['char_count']} chars, "
-                            f"{result['duration_seconds']:.1f}s"
-                        )
-                        logger.info(
-                            f"    {result['llm'].value}: "
-                            f"accuracy={eval_result.overall_accuracy:.0%} "
-                            f"({eval_result.features_correct}/{len(eval_result.feature_scores)} correct)"
-                        )
-                    else:
-                        logger.error(
-                            f"  {result['crawler'].value}+{result['llm'].value} cached run failed: "
-                            f"{result['error']}"
-                        )
-                        all_results.append(EvaluationResult(
-                            domain=domain,
-                            crawler=result["crawler"],
-                            llm=result["llm"],
-                            overall_accuracy=0.0,
-                            features_found=0,
-                            features_correct=0,
-                            overall_presence_accuracy=0.0,
-                            features_present_correct=0,
-                            errors=[result["error"]],
-                        ))
-                    done += 1
-                    logger.info(f"  Progress: {done}/{total}")
-                continue
-
-            # Phase 1: Crawl with all crawlers (unless cache-only)
-            crawl_results = []
-            if not use_cache_only:
-                crawl_results = await self._crawl_domain(domain, crawlers, pages, max_pages)
-            else:
-                # Load cached crawl/parse for each crawler (any llm) and skip crawling
-                for ct in crawlers:
-                    cached_any = self._load_any_cached_artifact(
-                        domain, ct.value, self.config.output_dir
-                    )
-                    if cached_any is None:
-                        logger.error(f"  {ct.value} cached run failed: Missing cached artifact for {domain}")
-                        for llm_type in llms:
-                            all_results.append(EvaluationResult(
-                                domain=domain,
-                                crawler=ct,
-                                llm=llm_type,
-                                overall_accuracy=0.0,
-                                features_found=0,
-                                features_correct=0,
-                                overall_presence_accuracy=0.0,
-                                features_present_correct=0,
-                                errors=[f"Missing cached artifact for {domain} {ct.value}"],
-                            ))
-                            done += 1
-                            logger.info(f"  Progress: {done}/{total}")
-                        continue
-                    crawl_result, parsed_cached, _ = cached_any
-                    crawl_results.append((crawl_result, parsed_cached))
-
-            for item in crawl_results:
-                if use_cache_only:
-                    crawl_result, parsed = item
-                else:
-                    crawl_result = item
-                if crawl_result.error and not crawl_result.raw_content:
-                    logger.warning(f"  {crawl_result.crawler.value} failed: {crawl_result.error}")
-                    for llm_type in llms:
-                        all_results.append(EvaluationResult(
-                            domain=domain,
-                            crawler=crawl_result.crawler,
-                            llm=llm_type,
-                            overall_accuracy=0.0,
-                            features_found=0,
-                            features_correct=0,
-                            overall_presence_accuracy=0.0,
-                            features_present_correct=0,
-                            errors=[f"Crawl failed: {crawl_result.error}"],
-                        ))
-                        done += 1
-                    continue
-
-                # Phase 2: Parse (skip if cache-only and we already have parsed)
-                if not use_cache_only:
-                    parsed = self.parser.parse(crawl_result)
-                logger.info(
-                    f"  {crawl_result.crawler.value}: "
-                    f"{len(crawl_result.page_contents)} pages, "
-                    f"{parsed.char_count} chars, "
-                    f"{crawl_result.duration_seconds:.1f}s, "
-                    f"links: {crawl_result.homepage_internal_links} internal "
-                    f"({crawl_result.homepage_internal_links_crawled} crawled), "
-                    f"{crawl_result.homepage_external_links} external, "
-                    f"{crawl_result.homepage_total_links} total"
-                )
-
-                # Phase 3: Extract with each LLM
-                for llm_type in llms:
-                    try:
-                        cached = self._load_cached_artifact(
-                            domain, crawl_result.crawler.value, llm_type.value, self.config.output_dir
-                        )
-                        if cached is not None:
-                            _, _, extraction = cached
-                            logger.info(f"    {llm_type.value}: using cached extraction")
-                        else:
-                            extractor = get_extractor(llm_type, self.config)
-                            extraction = await extractor.extract(parsed)
-
-                        if extraction.error:
-                            logger.warning(f"    {llm_type.value} error: {extraction.error}")
-
-                        # Phase 4: Evaluate
-                        eval_result = self.comparator.evaluate(extraction)
-                        eval_result.homepage_internal_links = crawl_result.homepage_internal_links
-                        eval_result.homepage_internal_links_crawled = crawl_result.homepage_internal_links_crawled
-                        eval_result.homepage_total_links = crawl_result.homepage_total_links
-                        eval_result.homepage_external_links = crawl_result.homepage_external_links
-                        all_results.append(eval_result)
-
-                        logger.info(
-                            f"    {llm_type.value}: "
-                            f"accuracy={eval_result.overall_accuracy:.0%} "
-                            f"({eval_result.features_correct}/{len(eval_result.feature_scores)} correct)"
-                        )
-
-                        if llm_compare:
-                            gt_map = self.comparator.get_normalized_ground_truth(extraction.domain)
-                            if gt_map:
-                                extracted_vals = extraction.features
-                                gt_vals = {k: v["value"] for k, v in gt_map.items()}
-                                try:
-                                    openai_scores = self._load_llm_comparison(
+                                extraction, stats = cached
+
+                                eval_result = self.comparator.evaluate(extraction)
+                                eval_result.homepage_internal_links = stats.homepage_internal_links
+                                eval_result.homepage_internal_links_crawled = stats.homepage_internal_links_crawled
+                                eval_result.homepage_total_links = stats.homepage_total_links
+                                eval_result.homepage_external_links = stats.homepage_external_links
+
+                                # Cached per domain by the comparator, so combos share one dict
+                                gt_vals = self.comparator.get_ground_truth_values(extraction.domain)
+                                if gt_vals:
+                                    extracted_vals = extraction.features
+                                    openai_scores = await self._load_llm_comparison(
                                         extraction.domain,
-                                        crawl_result.crawler.value,
+                                        ct.value,
                                         llm_type.value,
                                         self.config.output_dir,
                                     )
@@ -268,34 +217,194 @@ class BenchmarkRunner:
                                         if save_intermediate:
                                             self._save_llm_comparison(
                                                 extraction.domain,
-                                                crawl_result.crawler.value,
+                                                ct.value,
                                                 llm_type.value,
                                                 openai_scores,
                                                 self.config.output_dir,
                                             )
                                     self._apply_llm_compare_scores(eval_result, openai_scores)
-                                except Exception as e:
-                                    logger.warning(f"    LLM compare failed: {e}")
-                        if save_intermediate and cached is None:
-                            self._save_intermediate_artifacts(
-                                crawl_result, parsed, extraction, self.config.output_dir
+
+                                return {
+                                    "ok": True,
+                                    "crawler": ct,
+                                    "llm": llm_type,
+                                    "eval_result": eval_result,
+                                    "page_count": stats.page_count,
+                                    "char_count": stats.char_count,
+                                    "duration_seconds": stats.duration_seconds,
+                                }
+                            except Exception as e:
+                                return {
+                                    "ok": False,
+                                    "crawler": ct,
+                                    "llm": llm_type,
+                                    "error": str(e),
+                                }
+
+                    tasks = [
+                        asyncio.create_task(_process_cached_combo(ct, llm_type))
+                        for ct in crawlers
+                        for llm_type in llms
+                    ]
+
+                    for completed in asyncio.as_completed(tasks):
+                        result = await completed
+                        if result["ok"]:
+                            eval_result = result["eval_result"]
+                            all_results.append(eval_result)
+                            logger.info(
+                                "  %s (cached): %s pages, %s chars, %.1fs",
+                                result["crawler"].value,
+                                result["page_count"],
+                                result["char_count"],
+                                result["duration_seconds"],
                             )
-                    except Exception as e:
-                        logger.error(f"    {llm_type.value} failed: {e}")
-                        all_results.append(EvaluationResult(
-                            domain=domain,
-                            crawler=crawl_result.crawler,
-                            llm=llm_type,
-                            overall_accuracy=0.0,
-                            features_found=0,
-                            features_correct=0,
-                            overall_presence_accuracy=0.0,
-                            features_present_correct=0,
-                            errors=[str(e)],
-                        ))
-                    done += 1
-                    logger.info(f"  Progress: {done}/{total}")
+                            # The accuracy line uses a format spec, so it is only built when INFO is on
+                            if logger.isEnabledFor(logging.INFO):
+                                logger.info(
+                                    f"    {result['llm'].value}: "
+                                    f"accuracy={eval_result.overall_accuracy:.0%} "
+                                    f"({eval_result.features_correct}/{len(eval_result.feature_scores)} correct)"
+                                )
+                        else:
+                            logger.error(
+                                f"  {result['crawler'].value}+{result['llm'].value} cached run failed: "
+                                f"{result['error']}"
+                            )
+                            all_results.append(_failed_result(
+                                domain, result["crawler"], result["llm"],
+                                result["error"],
+                            ))
+                        done += 1
+                        logger.info("  Progress: %s/%s", done, total)
+                    continue
+
+                # Phase 1: Crawl with all crawlers (unless cache-only)
+                crawl_results = []
+                if not use_cache_only:
+                    crawled = await self._crawl_domain(domain, crawlers, pages, max_pages)
+                    # Phase 2: Parse all crawls up front in worker threads, so the
+                    # event loop isn't held while the pages are cleaned
+                    parsed_list = await asyncio.gather(*(
+                        asyncio.to_thread(self.parser.parse, cr) for cr in crawled
+                    ))
+                    crawl_results = [(cr, parsed, None) for cr, parsed in zip(crawled, parsed_list)]
+                else:
+                    # Load cached crawl/parse for each crawler (any llm) and skip crawling
+                    for ct in crawlers:
+                        cached_any = await self._load_any_cached_artifact(
+                            domain, ct.value, self.config.output_dir
+                        )
+                        if cached_any is None:
+                            logger.error(f"  {ct.value} cached run failed: Missing cached artifact for {domain}")
+                            for llm_type in llms:
+                                all_results.append(_failed_result(
+                                    domain, ct, llm_type,
+                                    f"Missing cached artifact for {domain} {ct.value}",
+                                ))
+                                done += 1
+                                logger.info("  Progress: %s/%s", done, total)
+                            continue
+                        # Keep the loaded extraction with its crawl, so the LLM loop below
+                        # reuses it instead of re-reading the same artifact
+                        crawl_results.append(cached_any)
+
+                for crawl_result, parsed, cached_extraction in crawl_results:
+                    if crawl_result.error and not crawl_result.raw_content:
+                        logger.warning(f"  {crawl_result.crawler.value} failed: {crawl_result.error}")
+                        for llm_type in llms:
+                            all_results.append(_failed_result(
+                                domain, crawl_result.crawler, llm_type,
+                                f"Crawl failed: {crawl_result.error}",
+                            ))
+                            done += 1
+                        continue
 
+                    logger.info(
+                        "  %s: %s pages, %s chars, %.1fs, links: %s internal (%s crawled), %s external, %s total",
+                        crawl_result.crawler.value,
+                        len(crawl_result.page_contents),
+                        parsed.char_count,
+                        crawl_result.duration_seconds,
+                        crawl_result.homepage_internal_links,
+                        crawl_result.homepage_internal_links_crawled,
+                        crawl_result.homepage_external_links,
+                        crawl_result.homepage_total_links,
+                    )
+
+                    # Phase 3: Extract with each LLM
+                    for llm_type in llms:
+                        try:
+                            if cached_extraction is not None and cached_extraction.llm is llm_type:
+                                cached = (crawl_result, parsed, cached_extraction)
+                            else:
+                                cached = await self._load_cached_artifact(
+                                    domain, crawl_result.crawler.value, llm_type.value, self.config.output_dir
+                                )
+                            if cached is not None:
+                                _, _, extraction = cached
+                                logger.info("    %s: using cached extraction", llm_type.value)
+                            else:
+                                extractor = self._get_extractor(llm_type)
+                                extraction = await extractor.extract(parsed)
+
+                            if extraction.error:
+                                logger.warning(f"    {llm_type.value} error: {extraction.error}")
+
+                            # Phase 4: Evaluate
+                            eval_result = self.comparator.evaluate(extraction)
+                            eval_result.homepage_internal_links = crawl_result.homepage_internal_links
+                            eval_result.homepage_internal_links_crawled = crawl_result.homepage_internal_links_crawled
+                            eval_result.homepage_total_links = crawl_result.homepage_total_links
+                            eval_result.homepage_external_links = crawl_result.homepage_external_links
+                            all_results.append(eval_result)
+
+                            if logger.isEnabledFor(logging.INFO):
+                                logger.info(
+                                    f"    {llm_type.value}: "
+                                    f"accuracy={eval_result.overall_accuracy:.0%} "
+                                    f"({eval_result.features_correct}/{len(eval_result.feature_scores)} correct)"
+                                )
+
+                            if llm_compare:
+                                # Cached per domain by the comparator, so combos share one dict
+                                gt_vals = self.comparator.get_ground_truth_values(extraction.domain)
+                                if gt_vals:
+                                    extracted_vals = extraction.features
+                                    try:
+                                        openai_scores = await self._load_llm_comparison(
+                                            extraction.domain,
+                                            crawl_result.crawler.value,
+                                            llm_type.value,
+                                            self.config.output_dir,
+                                        )
+                                        if openai_scores is None:
+                                            openai_scores = await llm_value_comparator.compare_openai(
+                                                extracted_vals, gt_vals
+                                            )
+                                            if save_intermediate:
+                                                self._save_llm_comparison(
+                                                    extraction.domain,
+                                                    crawl_result.crawler.value,
+                                                    llm_type.value,
+                                                    openai_scores,
+                                                    self.config.output_dir,
+                                                )
+                                        self._apply_llm_compare_scores(eval_result, openai_scores)
+                                    except Exception as e:
+                                        logger.warning(f"    LLM compare failed: {e}")
+                            if save_intermediate and cached is None:
+                                self._save_intermediate_artifacts(
+                                    crawl_result, parsed, extraction, self.config.output_dir
+                                )
+                        except Exception as e:
+                            logger.error(f"    {llm_type.value} failed: {e}")
+                            all_results.append(_failed_result(domain, crawl_result.crawler, llm_type, str(e)))
+                        done += 1
+                        logger.info("  Progress: %s/%s", done, total)
+
+        finally:
+            await self.close()
         return self._build_report(all_results)
 
     async def _crawl_domain(
@@ -319,7 +428,7 @@ class BenchmarkRunner:
             api_tasks = []
             for ct in api_crawlers:
                 try:
-                    crawler = get_crawler(ct, self.config)
+                    crawler = self._get_crawler(ct)
                     task = crawler.crawl(domain, pages, max_pages=max_pages)
                     api_tasks.append((ct, task))
                 except Exception as e:
@@ -355,7 +464,7 @@ class BenchmarkRunner:
             logger.debug(f"  Running {len(local_crawlers)} local crawlers with rate limiting")
             for ct in local_crawlers:
                 try:
-                    crawler = get_crawler(ct, self.config)
+                    crawler = self._get_crawler(ct)
                     result = await crawler.crawl(domain, pages, max_pages=max_pages)
                     results.append(result)
                 except Exception as e:
@@ -383,7 +492,7 @@ class BenchmarkRunner:
 
         return BenchmarkReport(
             timestamp=datetime.now(),
-            total_domains=len(set(r.domain for r in results)),
+            total_domains=len({r.domain for r in results}),
             total_combinations=len(results),
             results=results,
             summary_by_crawler=summary_by_crawler,
@@ -394,16 +503,19 @@ class BenchmarkRunner:
             summary_by_combo_presence=summary_by_combo_presence,
         )
 
-    def save_results(self, report: BenchmarkReport, output_dir: Path, fmt: str = "json"):
+    async def save_results(self, report: BenchmarkReport, output_dir: Path, fmt: str = "json"):
         output_dir.mkdir(parents=True, exist_ok=True)
         ts = report.timestamp.strftime("%Y%m%d_%H%M%S")
 
+        # Reports can run to several MB; write them in worker threads, side by side
+        writes = []
         if fmt in ("json", "all"):
-            self._save_json(report, output_dir / f"benchmark_{ts}.json")
+            writes.append(asyncio.to_thread(self._save_json, report, output_dir / f"benchmark_{ts}.json"))
 
         if fmt in ("csv", "all"):
-            self._save_csv(report, output_dir / f"benchmark_{ts}.csv")
+            writes.append(asyncio.to_thread(self._save_csv, report, output_dir / f"benchmark_{ts}.csv"))
 
+        await asyncio.gather(*writes)
         logger.info(f"Results saved to {output_dir}/")
 
     def _save_intermediate_artifacts(
@@ -413,15 +525,12 @@ class BenchmarkRunner:
         extraction: ExtractedFeatures,
         output_dir: Path,
     ):
-        import re
-
-        def slugify(text: str) -> str:
-            return re.sub(r"[^a-zA-Z0-9._-]+", "_", text).strip("_")
-
-        domain_key = slugify(crawl_result.domain.replace("https://", "").replace("http://", ""))
-        base_dir = output_dir / "intermediate" / domain_key / crawl_result.crawler.value
+        domain_key = _domain_key(crawl_result.domain)
+        base_dir = _intermediate_path(output_dir, crawl_result.domain, crawl_result.crawler.value)
         base_dir.mkdir(parents=True, exist_ok=True)
         path = base_dir / f"{extraction.llm.value}.json"
+        # A new artifact may change which one _load_any_cached_artifact should pick
+        self._any_cache.pop((domain_key, crawl_result.crawler.value), None)
 
         payload = {
             "domain": crawl_result.domain,
@@ -451,26 +560,29 @@ class BenchmarkRunner:
             },
         }
 
-        with open(path, "w") as f:
-            json.dump(payload, f, indent=2, default=str)
+        path.write_bytes(jsonio.dumps(payload, indent=True))
 
-    def _load_cached_artifact(
+    @staticmethod
+    def _read_json(path: Path) -> Optional[dict]:
+        """Parse a JSON artifact, or None if it does not exist."""
+        try:
+            raw = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        return jsonio.loads(raw)
+
+    async def _load_cached_artifact(
         self, domain: str, crawler: str, llm: str, output_dir: Path
     ) -> Optional[tuple[CrawlResult, ParsedContent, ExtractedFeatures]]:
-        import re
-
-        def slugify(text: str) -> str:
-            return re.sub(r"[^a-zA-Z0-9._-]+", "_", text).strip("_")
-
-        domain_key = slugify(domain.replace("https://", "").replace("http://", ""))
-        path = output_dir / "intermediate" / domain_key / crawler / f"{llm}.json"
-        if not path.exists():
+        path = _intermediate_path(output_dir, domain, crawler, f"{llm}.json")
+        # Artifacts run to several MB; read and parse off the event loop so concurrent
+        # cached combos (llm_compare) load in parallel instead of blocking each other
+        data = await asyncio.to_thread(self._read_json, path)
+        if data is None:
             return None
-        data = json.loads(path.read_text())
 
         crawl = data.get("crawl", {})
         parsed = data.get("parsed", {})
-        extraction = data.get("extraction", {})
 
         crawl_result = CrawlResult(
             domain=data.get("domain", domain),
@@ -494,9 +606,37 @@ class BenchmarkRunner:
             char_count=parsed.get("char_count", 0),
         )
 
-        extraction_obj = ExtractedFeatures(
-            domain=crawl_result.domain,
-            crawler=crawl_result.crawler,
+        extraction_obj = self._extraction_from_artifact(data, domain, crawler, llm)
+        return crawl_result, parsed_content, extraction_obj
+
+    async def _load_extraction_only(
+        self, domain: str, crawler: str, llm: str, output_dir: Path
+    ) -> Optional[tuple[ExtractedFeatures, _ArtifactStats]]:
+        """Extraction plus crawl/parse stats from a saved artifact, skipping the
+        CrawlResult/ParsedContent rebuild for callers that never touch page text."""
+        path = _intermediate_path(output_dir, domain, crawler, f"{llm}.json")
+        data = await asyncio.to_thread(self._read_json, path)
+        if data is None:
+            return None
+
+        crawl = data.get("crawl", {})
+        stats = _ArtifactStats(
+            page_count=len(crawl.get("page_contents", {})),
+            char_count=data.get("parsed", {}).get("char_count", 0),
+            duration_seconds=crawl.get("duration_seconds", 0.0),
+            homepage_internal_links=crawl.get("homepage_internal_links", 0),
+            homepage_internal_links_crawled=crawl.get("homepage_internal_links_crawled", 0),
+            homepage_external_links=crawl.get("homepage_external_links", 0),
+            homepage_total_links=crawl.get("homepage_total_links", 0),
+        )
+        return self._extraction_from_artifact(data, domain, crawler, llm), stats
+
+    @staticmethod
+    def _extraction_from_artifact(data: dict, domain: str, crawler: str, llm: str) -> ExtractedFeatures:
+        extraction = data.get("extraction", {})
+        return ExtractedFeatures(
+            domain=data.get("domain", domain),
+            crawler=CrawlerType(crawler),
             llm=LLMType(llm),
             extracted_at=datetime.now(),
             features=extraction.get("features", {}),
@@ -504,28 +644,36 @@ class BenchmarkRunner:
             error=extraction.get("error"),
         )
 
-        return crawl_result, parsed_content, extraction_obj
+    @staticmethod
+    def _first_artifact_stem(base_dir: Path) -> Optional[str]:
+        """Stem of the first (sorted) non-compare .json artifact in base_dir, if any."""
+        try:
+            with os.scandir(base_dir) as it:
+                names = [
+                    entry.name for entry in it
+                    if entry.name.endswith(".json") and not entry.name.endswith("_llm_compare.json")
+                ]
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        return min(names)[:-len(".json")] if names else None
 
-    def _load_any_cached_artifact(
+    async def _load_any_cached_artifact(
         self, domain: str, crawler: str, output_dir: Path
     ) -> Optional[tuple[CrawlResult, ParsedContent, ExtractedFeatures]]:
-        import re
-
-        def slugify(text: str) -> str:
-            return re.sub(r"[^a-zA-Z0-9._-]+", "_", text).strip("_")
-
-        domain_key = slugify(domain.replace("https://", "").replace("http://", ""))
-        base_dir = output_dir / "intermediate" / domain_key / crawler
-        if not base_dir.exists():
+        domain_key = _domain_key(domain)
+        key = (domain_key, crawler)
+        if key in self._any_cache:
+            llm = self._any_cache[key]
+        else:
+            base_dir = _intermediate_path(output_dir, domain, crawler)
+            llm = await asyncio.to_thread(self._first_artifact_stem, base_dir)
+            self._any_cache[key] = llm
+        if llm is None:
             return None
-        for path in sorted(base_dir.glob("*.json")):
-            if path.name.endswith("_llm_compare.json"):
-                continue
-            llm = path.stem
-            return self._load_cached_artifact(domain, crawler, llm, output_dir)
-        return None
+        return await self._load_cached_artifact(domain, crawler, llm, output_dir)
 
     def _save_json(self, report: BenchmarkReport, path: Path):
+        round2, round4 = _RoundMemo(2), _RoundMemo(4)
         data = {
             "timestamp": report.timestamp.isoformat(),
             "total_domains": report.total_domains,
@@ -541,18 +689,18 @@ class BenchmarkRunner:
                     "domain": r.domain,
                     "crawler": r.crawler.value,
                     "llm": r.llm.value,
-                    "overall_accuracy": round(r.overall_accuracy, 4),
+                    "overall_accuracy": round4[r.overall_accuracy],
                     "features_found": r.features_found,
                     "features_correct": r.features_correct,
-                    "overall_presence_accuracy": round(r.overall_presence_accuracy, 4),
+                    "overall_presence_accuracy": round4[r.overall_presence_accuracy],
                     "features_present_correct": r.features_present_correct,
                     "feature_scores": {
                         fs.feature_name: {
-                            "score": round(fs.score, 2),
+                            "score": round2[fs.score],
                             "match_type": fs.match_type,
                             "extracted": fs.extracted_value,
                             "ground_truth": fs.ground_truth_value
-                                if not isinstance(fs.ground_truth_value, (dict,))
+                                if not isinstance(fs.ground_truth_value, dict)
                                 else str(fs.ground_truth_value),
                         }
                         for fs in r.feature_scores
@@ -565,7 +713,7 @@ class BenchmarkRunner:
                     },
                     "presence_scores": {
                         ps.feature_name: {
-                            "score": round(ps.score, 2),
+                            "score": round2[ps.score],
                             "match_type": ps.match_type,
                             "extracted_present": ps.extracted_present,
                             "ground_truth_present": ps.ground_truth_present,
@@ -577,8 +725,7 @@ class BenchmarkRunner:
                 for r in report.results
             ],
         }
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2, default=str)
+        path.write_bytes(jsonio.dumps(data, indent=True))
         logger.info(f"  JSON: {path}")
 
     def _save_llm_comparison(
@@ -589,12 +736,7 @@ class BenchmarkRunner:
         openai_scores: list,
         output_dir: Path,
     ):
-        import re
-        def slugify(text: str) -> str:
-            return re.sub(r"[^a-zA-Z0-9._-]+", "_", text).strip("_")
-
-        domain_key = slugify(domain.replace("https://", "").replace("http://", ""))
-        base_dir = output_dir / "intermediate" / domain_key / crawler
+        base_dir = _intermediate_path(output_dir, domain, crawler)
         base_dir.mkdir(parents=True, exist_ok=True)
         path = base_dir / f"{llm}_llm_compare.json"
         payload = {
@@ -603,26 +745,19 @@ class BenchmarkRunner:
             "llm": llm,
             "openai": openai_scores,
         }
-        with open(path, "w") as f:
-            json.dump(payload, f, indent=2, default=str)
+        path.write_bytes(jsonio.dumps(payload, indent=True))
 
-    def _load_llm_comparison(
+    async def _load_llm_comparison(
         self,
         domain: str,
         crawler: str,
         llm: str,
         output_dir: Path,
     ) -> Optional[list]:
-        import re
-
-        def slugify(text: str) -> str:
-            return re.sub(r"[^a-zA-Z0-9._-]+", "_", text).strip("_")
-
-        domain_key = slugify(domain.replace("https://", "").replace("http://", ""))
-        path = output_dir / "intermediate" / domain_key / crawler / f"{llm}_llm_compare.json"
-        if not path.exists():
+        path = _intermediate_path(output_dir, domain, crawler, f"{llm}_llm_compare.json")
+        data = await asyncio.to_thread(self._read_json, path)
+        if data is None:
             return None
-        data = json.loads(path.read_text())
         return data.get("openai")
 
     def _apply_llm_compare_scores(self, eval_result: EvaluationResult, openai_scores: list):
@@ -647,15 +782,24 @@ class BenchmarkRunner:
                 fs.match_type = "llm_similarity"
 
         if eval_result.feature_scores:
-            eval_result.overall_accuracy = sum(fs.score for fs in eval_result.feature_scores) / len(eval_result.feature_scores)
-            eval_result.features_correct = sum(1 for fs in eval_result.feature_scores if fs.score >= 0.8)
+            # One pass for both the mean score and the correct count
+            total = 0.0
+            correct = 0
+            for fs in eval_result.feature_scores:
+                score = fs.score
+                total += score
+                if score >= 0.8:
+                    correct += 1
+            eval_result.overall_accuracy = total / len(eval_result.feature_scores)
+            eval_result.features_correct = correct
 
 
     def _save_csv(self, report: BenchmarkReport, path: Path):
         import csv
-        from src.types import FEATURES
 
-        with open(path, "w", newline="") as f:
+        round2, round4 = _RoundTextMemo(2), _RoundTextMemo(4)
+        # A large buffer coalesces the per-row writes into few syscalls
+        with open(path, "w", newline="", buffering=1 << 20) as f:
             writer = csv.writer(f)
             header = [
                 "domain", "crawler", "llm",
@@ -668,20 +812,28 @@ class BenchmarkRunner:
             header += [f"{feat}_extracted" for feat in FEATURES]
             writer.writerow(header)
 
-            for r in report.results:
-                row = [
-                    r.domain, r.crawler.value, r.llm.value,
-                    round(r.overall_accuracy, 4), r.features_found, r.features_correct,
-                    round(r.overall_presence_accuracy, 4), r.features_present_correct,
-                    r.homepage_internal_links, r.homepage_internal_links_crawled,
-                    r.homepage_external_links, r.homepage_total_links,
-                ]
-                score_map = {fs.feature_name: fs for fs in r.feature_scores}
-                for feat in FEATURES:
-                    fs = score_map.get(feat)
-                    row.append(round(fs.score, 2) if fs else 0.0)
-                for feat in FEATURES:
-                    fs = score_map.get(feat)
-                    row.append(fs.extracted_value if fs else None)
-                writer.writerow(row)
+            def rows():
+                for r in report.results:
+                    row = [
+                        r.domain, r.crawler.value, r.llm.value,
+                        round4[r.overall_accuracy], r.features_found, r.features_correct,
+                        round4[r.overall_presence_accuracy], r.features_present_correct,
+                        r.homepage_internal_links, r.homepage_internal_links_crawled,
+                        r.homepage_external_links, r.homepage_total_links,
+                    ]
+                    # One pass over the scores fills both per-feature blocks by position;
+                    # a repeated feature keeps its last score, unknown names are skipped
+                    scores = [_ZERO_SCORE_TEXT] * len(FEATURES)
+                    extracted = [None] * len(FEATURES)
+                    for fs in r.feature_scores:
+                        i = FEATURE_INDEX.get(fs.feature_name)
+                        if i is not None:
+                            scores[i] = round2[fs.score]
+                            extracted[i] = fs.extracted_value
+                    row += scores
+                    row += extracted
+                    yield row
+
+            # One writerows call keeps the row loop inside the csv module
+            writer.writerows(rows())
         logger.info(f"  CSV: {path}")
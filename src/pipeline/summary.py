@@ -1,10 +1,35 @@
+import sys
 from typing import Dict, List, Tuple
 
-from src.types import EvaluationResult
+import numpy as np
 
+from src.types import CrawlerType, EvaluationResult, LLMType
 
-def _avg(vals: List[float]) -> float:
-    return sum(vals) / len(vals) if vals else 0.0
+# "crawler+llm" label of every (crawler, llm) pair, formatted once at import
+_COMBO_NAMES: Dict[Tuple[CrawlerType, LLMType], str] = {
+    (crawler, llm): f"{crawler.value}+{llm.value}" for crawler in CrawlerType for llm in LLMType
+}
+
+
+def _group_means(
+    pair_ids: np.ndarray, pair_to_group: List[int], groups: List[str],
+    accuracy: np.ndarray, presence: np.ndarray,
+) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """Per-group mean accuracy and presence, given each result's (crawler, llm) pair id."""
+    group_ids = np.asarray(pair_to_group, dtype=np.intp)[pair_ids]
+    counts = np.bincount(group_ids, minlength=len(groups))
+    # bincount adds the weights in result order, matching sum() over each group's scores
+    accuracy_means = np.bincount(group_ids, weights=accuracy, minlength=len(groups)) / counts
+    presence_means = np.bincount(group_ids, weights=presence, minlength=len(groups)) / counts
+    return (
+        dict(zip(groups, accuracy_means.tolist())),
+        dict(zip(groups, presence_means.tolist())),
+    )
+
+
+def _group_index(keys: List[str], index: Dict[str, int]) -> List[int]:
+    """Map each key to a dense id, numbering new keys in first-seen order."""
+    return [index.setdefault(key, len(index)) for key in keys]
 
 
 def compute_summary(
@@ -13,34 +38,65 @@ def compute_summary(
     Dict[str, float], Dict[str, float], Dict[str, float],
     Dict[str, float], Dict[str, float], Dict[str, float],
 ]:
-    by_crawler: Dict[str, List[float]] = {}
-    by_llm: Dict[str, List[float]] = {}
-    by_combo: Dict[str, List[float]] = {}
-    by_crawler_presence: Dict[str, List[float]] = {}
-    by_llm_presence: Dict[str, List[float]] = {}
-    by_combo_presence: Dict[str, List[float]] = {}
-
-    for r in results:
-        key = r.crawler.value
-        by_crawler.setdefault(key, []).append(r.overall_accuracy)
-        by_crawler_presence.setdefault(key, []).append(r.overall_presence_accuracy)
-
-        key = r.llm.value
-        by_llm.setdefault(key, []).append(r.overall_accuracy)
-        by_llm_presence.setdefault(key, []).append(r.overall_presence_accuracy)
-
-        key = f"{r.crawler.value}+{r.llm.value}"
-        by_combo.setdefault(key, []).append(r.overall_accuracy)
-        by_combo_presence.setdefault(key, []).append(r.overall_presence_accuracy)
+    if not results:
+        return {}, {}, {}, {}, {}, {}
+
+    # One Python pass assigns each result a dense (crawler, llm) pair id; the
+    # per-group sums then run in C through np.bincount
+    # Keyed by the enum members themselves: hashing them is far cheaper than
+    # reading .value per result, which is done once per distinct pair below
+    pairs: Dict[Tuple[CrawlerType, LLMType], int] = {}
+    pair_ids = np.fromiter(
+        (pairs.setdefault((r.crawler, r.llm), len(pairs)) for r in results),
+        dtype=np.intp, count=len(results),
+    )
+    accuracy = np.fromiter((r.overall_accuracy for r in results), dtype=np.float64, count=len(results))
+    presence = np.fromiter(
+        (r.overall_presence_accuracy for r in results), dtype=np.float64, count=len(results)
+    )
 
-    return (
-        {k: _avg(v) for k, v in by_crawler.items()},
-        {k: _avg(v) for k, v in by_llm.items()},
-        {k: _avg(v) for k, v in by_combo.items()},
-        {k: _avg(v) for k, v in by_crawler_presence.items()},
-        {k: _avg(v) for k, v in by_llm_presence.items()},
-        {k: _avg(v) for k, v in by_combo_presence.items()},
+    # Group keys in first-seen order, as the per-result dicts used to produce
+    crawler_index: Dict[str, int] = {}
+    llm_index: Dict[str, int] = {}
+    combo_index: Dict[str, int] = {}
+    pair_to_crawler = _group_index([crawler.value for crawler, _ in pairs], crawler_index)
+    pair_to_llm = _group_index([llm.value for _, llm in pairs], llm_index)
+    pair_to_combo = _group_index([_COMBO_NAMES[pair] for pair in pairs], combo_index)
+
+    by_crawler, by_crawler_presence = _group_means(
+        pair_ids, pair_to_crawler, list(crawler_index), accuracy, presence
+    )
+    by_llm, by_llm_presence = _group_means(pair_ids, pair_to_llm, list(llm_index), accuracy, presence)
+    by_combo, by_combo_presence = _group_means(
+        pair_ids, pair_to_combo, list(combo_index), accuracy, presence
     )
+    return by_crawler, by_llm, by_combo, by_crawler_presence, by_llm_presence, by_combo_presence
+
+
+_BAR_WIDTH = 30
+# Every bar for scores in [0, 1], indexed by filled width
+_BARS = tuple("█" * filled + "░" * (_BAR_WIDTH - filled) for filled in range(_BAR_WIDTH + 1))
+
+
+def _bar(score: float) -> str:
+    filled = int(score * _BAR_WIDTH)
+    if 0 <= filled <= _BAR_WIDTH:
+        return _BARS[filled]
+    # Out-of-range scores (e.g. an LLM similarity above 1.0) render as before
+    return "█" * filled + "░" * (_BAR_WIDTH - filled)
+
+
+def _by_score(summary: Dict[str, float]) -> List[Tuple[str, float]]:
+    """Highest score first; ties keep the summary's insertion order."""
+    return sorted(summary.items(), key=lambda item: -item[1])
+
+
+def _append_section(
+    lines: List[str], title: str, items: List[Tuple[str, float]], name_width: int
+):
+    lines.append(f"  {title}:")
+    for name, score in items:
+        lines.append(f"    {name:<{name_width}} {_bar(score)} {score:.1%}")
 
 
 def print_summary_stats(
@@ -53,45 +109,26 @@ def print_summary_stats(
     summary_by_llm_presence: Dict[str, float],
     summary_by_combo_presence: Dict[str, float],
 ):
-    print("\n" + "=" * 70)
-    print("  BENCHMARK RESULTS SUMMARY")
-    print("=" * 70)
-    print(f"  Domains tested:  {total_domains}")
-    print(f"  Combinations:    {total_combinations}")
-    print()
-
-    print("  Value Accuracy by Crawler:")
-    for name, score in sorted(summary_by_crawler.items()):
-        bar = "█" * int(score * 30) + "░" * (30 - int(score * 30))
-        print(f"    {name:<12} {bar} {score:.1%}")
-    print()
-
-    print("  Value Accuracy by LLM:")
-    for name, score in sorted(summary_by_llm.items()):
-        bar = "█" * int(score * 30) + "░" * (30 - int(score * 30))
-        print(f"    {name:<12} {bar} {score:.1%}")
-    print()
-
-    print("  Value Accuracy by Combination:")
-    for combo, score in sorted(summary_by_combo.items(), key=lambda x: -x[1]):
-        bar = "█" * int(score * 30) + "░" * (30 - int(score * 30))
-        print(f"    {combo:<22} {bar} {score:.1%}")
-    print()
-
-    print("  Presence Accuracy by Crawler:")
-    for name, score in sorted(summary_by_crawler_presence.items()):
-        bar = "█" * int(score * 30) + "░" * (30 - int(score * 30))
-        print(f"    {name:<12} {bar} {score:.1%}")
-    print()
-
-    print("  Presence Accuracy by LLM:")
-    for name, score in sorted(summary_by_llm_presence.items()):
-        bar = "█" * int(score * 30) + "░" * (30 - int(score * 30))
-        print(f"    {name:<12} {bar} {score:.1%}")
-    print()
-
-    print("  Presence Accuracy by Combination:")
-    for combo, score in sorted(summary_by_combo_presence.items(), key=lambda x: -x[1]):
-        bar = "█" * int(score * 30) + "░" * (30 - int(score * 30))
-        print(f"    {combo:<22} {bar} {score:.1%}")
-    print("=" * 70 + "\n")
+    # Collect the whole report and write it at once instead of one print per line
+    lines: List[str] = [
+        "\n" + "=" * 70,
+        "  BENCHMARK RESULTS SUMMARY",
+        "=" * 70,
+        f"  Domains tested:  {total_domains}",
+        f"  Combinations:    {total_combinations}",
+        "",
+    ]
+    sections = (
+        ("Value Accuracy by Crawler", sorted(summary_by_crawler.items()), 12),
+        ("Value Accuracy by LLM", sorted(summary_by_llm.items()), 12),
+        ("Value Accuracy by Combination", _by_score(summary_by_combo), 22),
+        ("Presence Accuracy by Crawler", sorted(summary_by_crawler_presence.items()), 12),
+        ("Presence Accuracy by LLM", sorted(summary_by_llm_presence.items()), 12),
+        ("Presence Accuracy by Combination", _by_score(summary_by_combo_presence), 22),
+    )
+    for i, (title, items, name_width) in enumerate(sections):
+        if i:
+            lines.append("")
+        _append_section(lines, title, items, name_width)
+    lines.append("=" * 70 + "\n")
+    sys.stdout.write("\n".join(lines) + "\n")
@@ -1,6 +1,6 @@
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Sequence
 from datetime import datetime
 
 # Re-export feature schema from models (single source of truth)
@@ -8,7 +8,9 @@ from src.models import (
     AugmentedCompany,
     FeatureType,
     FEATURES,
+    FEATURE_INDEX,
     FEATURE_TYPES,
+    FEATURE_TYPES_TUPLE,
     SKIP_FIELDS,
     GT_FIELD_MAP,
     GT_INVERTED_BOOLEANS,
@@ -30,7 +32,7 @@ class LLMType(str, Enum):
     HAIKU = "haiku"
 
 
-@dataclass
+@dataclass(slots=True)
 class CrawlResult:
     domain: str
     crawler: CrawlerType
@@ -45,7 +47,7 @@ class CrawlResult:
     duration_seconds: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedContent:
     domain: str
     crawler: CrawlerType
@@ -54,7 +56,7 @@ class ParsedContent:
     char_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedFeatures:
     domain: str
     crawler: CrawlerType
@@ -65,7 +67,7 @@ class ExtractedFeatures:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FeatureScore:
     feature_name: str
     extracted_value: Any
@@ -74,7 +76,7 @@ class FeatureScore:
     match_type: str  # "exact", "partial", "missing", "no_ground_truth"
 
 
-@dataclass
+@dataclass(slots=True)
 class PresenceScore:
     feature_name: str
     extracted_present: bool
@@ -83,7 +85,7 @@ class PresenceScore:
     match_type: str  # "exact", "mismatch"
 
 
-@dataclass
+@dataclass(slots=True)
 class EvaluationResult:
     domain: str
     crawler: CrawlerType
@@ -97,12 +99,14 @@ class EvaluationResult:
     homepage_total_links: int = 0
     homepage_external_links: int = 0
     homepage_internal_links_crawled: int = 0
-    feature_scores: List[FeatureScore] = field(default_factory=list)
-    presence_scores: List[PresenceScore] = field(default_factory=list)
-    errors: List[str] = field(default_factory=list)
+    # Empty tuples by default: results that never score (errors, missing ground
+    # truth) share one immutable empty instead of allocating lists per result
+    feature_scores: Sequence[FeatureScore] = ()
+    presence_scores: Sequence[PresenceScore] = ()
+    errors: Sequence[str] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkReport:
     timestamp: datetime
     total_domains: int